@@ -5,19 +5,20 @@ executes them automatically, scores the outputs, and displays
 results on a public leaderboard.
 """
 
+import hashlib
 import os
-import shutil
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import pandas as pd
 import streamlit as st
 
 from src.database import Database
 from src.notebook_runner import NotebookRunner
 from src.scorer import Scorer
-from src.leaderboard import LeaderboardManager
+from src.leaderboard import LeaderboardManager, format_timestamps
 from src.logger import get_logger, configure_warnings_logging
-from utils.validation import validate_submission
+from utils.validation import validate_submission, validate_upload
 
 # Configure warnings to be captured in logs
 configure_warnings_logging()
@@ -40,44 +41,92 @@ os.makedirs("data/outputs", exist_ok=True)
 if 'db' not in st.session_state:
     logger.info("Initializing application session state")
     st.session_state.db = Database("data/leaderboard.db")
-    st.session_state.notebook_runner = NotebookRunner("data/outputs", timeout_seconds=300)
-    st.session_state.scorer = Scorer(ground_truth_path="data/california_housing.csv")
     st.session_state.leaderboard_manager = LeaderboardManager(st.session_state.db)
+    st.session_state.executor = ThreadPoolExecutor(max_workers=2)
+    st.session_state.pending_submission = None
+    st.session_state.submission_result = None
     logger.info("Application initialized successfully")
 
-# Custom CSS
-st.markdown("""
-    <style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        text-align: center;
-        color: #1f77b4;
-        margin-bottom: 2rem;
-    }
-    .sub-header {
-        font-size: 1.5rem;
-        font-weight: bold;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-    }
-    .stat-box {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        text-align: center;
-    }
-    .stat-value {
-        font-size: 2rem;
-        font-weight: bold;
-        color: #1f77b4;
-    }
-    .stat-label {
-        font-size: 0.9rem;
-        color: #666;
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css() -> str:
+    """Read the app stylesheet once per process."""
+    with open(os.path.join(os.path.dirname(__file__), "static", "style.css"), encoding="utf-8") as f:
+        return f.read()
+
+
+# Custom CSS (must be emitted on every rerun, but the file is only read once)
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+
+def get_notebook_runner() -> NotebookRunner:
+    """Get the session's NotebookRunner, creating it on first use.
+
+    Only sessions that actually submit pay for kernel detection.
+    """
+    if 'notebook_runner' not in st.session_state:
+        st.session_state.notebook_runner = NotebookRunner(
+            "data/outputs", timeout_seconds=300, warm_kernels=1
+        )
+    return st.session_state.notebook_runner
+
+
+def get_scorer() -> Scorer:
+    """Get the session's Scorer, creating it on first use.
+
+    Only sessions that actually submit pay for loading the ground truth CSV.
+    """
+    if 'scorer' not in st.session_state:
+        st.session_state.scorer = Scorer(ground_truth_path="data/california_housing.csv")
+    return st.session_state.scorer
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_statistics(_leaderboard_manager: LeaderboardManager, db_version: int) -> dict:
+    """Overall statistics, recomputed only when the database version changes."""
+    return _leaderboard_manager.get_statistics()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_leaderboard_display_df(_leaderboard_manager: LeaderboardManager, db_version: int):
+    """Leaderboard DataFrame with medals applied, recomputed only when the database version changes."""
+    df = _leaderboard_manager.get_leaderboard_df()
+    return _leaderboard_manager.format_leaderboard_for_display(df)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_recent_submissions_df(_leaderboard_manager: LeaderboardManager, db_version: int, limit: int):
+    """Recent submissions DataFrame, recomputed only when the database version changes."""
+    return _leaderboard_manager.get_recent_submissions_df(limit=limit)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_user_stats(_leaderboard_manager: LeaderboardManager, db_version: int, username: str):
+    """Per-user statistics, recomputed only when the database version changes."""
+    return _leaderboard_manager.get_user_stats(username)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_submission_history_df(_leaderboard_manager: LeaderboardManager, db_version: int, username: str):
+    """Per-user submission history, recomputed only when the database version changes."""
+    return _leaderboard_manager.get_submission_history_df(username)
+
+
+@st.fragment(run_every="30s")
+def show_quick_stats():
+    """Display the sidebar quick stats.
+
+    Runs as a fragment so it refreshes on its own timer (picking up
+    submissions finished by other users) without rerunning the page.
+    """
+    stats = cached_statistics(
+        st.session_state.leaderboard_manager,
+        st.session_state.db.version
+    )
+    st.metric("Total Submissions", stats['total_submissions'])
+    st.metric("Active Users", stats['total_users'])
+
+    if stats['highest_score'] > 0:
+        st.metric("Highest Score", f"{stats['highest_score']:.2f}")
 
 
 def main():
@@ -103,12 +152,7 @@ def main():
 
         st.markdown("---")
         st.markdown("### Quick Stats")
-        stats = st.session_state.leaderboard_manager.get_statistics()
-        st.metric("Total Submissions", stats['total_submissions'])
-        st.metric("Active Users", stats['total_users'])
-
-        if stats['highest_score'] > 0:
-            st.metric("Highest Score", f"{stats['highest_score']:.2f}")
+        show_quick_stats()
 
     # Main content based on selected page
     if page == "Home & Submit":
@@ -159,17 +203,27 @@ def show_submission_page():
             help="Upload your Jupyter notebook file (max 10MB)"
         )
 
-        # Submit button
-        if st.button("Submit", type="primary"):
+        # Show progress of a submission still being processed
+        if st.session_state.pending_submission is not None:
+            show_pending_submission()
 
-            if not username:
-                st.error("Please enter a username")
+        else:
+            # Show the outcome of a submission that just finished, once
+            if st.session_state.submission_result is not None:
+                show_submission_result(st.session_state.submission_result)
+                st.session_state.submission_result = None
 
-            elif not uploaded_file:
-                st.error("Please upload a notebook file")
+            # Submit button
+            if st.button("Submit", type="primary"):
 
-            else:
-                process_submission(username, uploaded_file)
+                if not username:
+                    st.error("Please enter a username")
+
+                elif not uploaded_file:
+                    st.error("Please upload a notebook file")
+
+                else:
+                    process_submission(username, uploaded_file)
 
     with col2:
 
@@ -195,110 +249,221 @@ def process_submission(username: str, uploaded_file):
     """
     logger.info(f"Processing submission from user '{username}', file: {uploaded_file.name}")
 
-    # Create temporary file for uploaded notebook
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.ipynb') as tmp_file:
-        tmp_file.write(uploaded_file.getvalue())
-        tmp_path = tmp_file.name
+    # Reject bad usernames and oversize/empty uploads before touching disk
+    is_valid, error_msg = validate_upload(username, uploaded_file.size)
+    if not is_valid:
+        logger.warning(f"Upload rejected for '{username}': {error_msg}")
+        st.error(f"Validation Error: {error_msg}")
+        return
 
-    try:
+    # Stream the upload straight into the submissions directory
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    submission_filename = f"{username}_{timestamp}.ipynb"
+    submission_path = os.path.join("data/submissions", submission_filename)
+    os.makedirs("data/submissions", exist_ok=True)
+
+    # Hash the notebook while it is written so identical resubmissions can be detected
+    digest = hashlib.sha256()
+    uploaded_file.seek(0)
+    with open(submission_path, "wb") as f:
+        for chunk in iter(lambda: uploaded_file.read(1024 * 1024), b""):
+            digest.update(chunk)
+            f.write(chunk)
+    notebook_hash = digest.hexdigest()
+
+    # Skip execution entirely if this exact notebook was already scored
+    existing = st.session_state.db.find_submission_by_hash(username, notebook_hash)
+    if existing:
+        logger.info(
+            f"Duplicate notebook from '{username}' matches submission ID {existing['id']}, skipping execution"
+        )
+        os.remove(submission_path)
+        # Completed rows imported without a score have a NULL score
+        score_str = f"{existing['score']:.2f}" if existing['score'] is not None else "N/A"
+        st.info(
+            f"This notebook was already scored as submission #{existing['id']} "
+            f"(score: {score_str}). Change your notebook to submit again."
+        )
+        return
 
-        # Validate submission
-        with st.spinner("Validating submission..."):
-            is_valid, error_msg = validate_submission(tmp_path, username)
+    # Validate submission
+    with st.spinner("Validating submission..."):
+        is_valid, error_msg = validate_submission(submission_path, username)
+
+        if not is_valid:
+            logger.warning(f"Validation failed for '{username}': {error_msg}")
+            st.error(f"Validation Error: {error_msg}")
+            os.remove(submission_path)
+            return
+
+    logger.info(f"Validation passed for '{username}'")
+    st.success("Validation passed!")
+    logger.info(f"Saved submission to: {submission_path}")
+
+    # Add to database
+    submission_id = st.session_state.db.add_submission(
+        username=username,
+        notebook_path=submission_path,
+        status="running",
+        notebook_hash=notebook_hash
+    )
 
-            if not is_valid:
-                logger.warning(f"Validation failed for '{username}': {error_msg}")
-                st.error(f"Validation Error: {error_msg}")
-                return
+    # Execute and score off the Streamlit script thread
+    logger.info(f"Queueing execution for submission ID {submission_id}")
+    future = st.session_state.executor.submit(
+        run_and_score,
+        st.session_state.db,
+        get_notebook_runner(),
+        get_scorer(),
+        username,
+        submission_id,
+        submission_path
+    )
+
+    st.session_state.pending_submission = {
+        'id': submission_id,
+        'username': username,
+        'future': future
+    }
+
+    st.rerun()
+
+
+def run_and_score(
+    db: Database,
+    notebook_runner: NotebookRunner,
+    scorer: Scorer,
+    username: str,
+    submission_id: int,
+    submission_path: str
+) -> dict:
+    """Execute and score a submission, recording the outcome in the database.
+
+    Runs in a background worker thread, so it must not touch st.session_state
+    or any other Streamlit API.
+
+    Args:
+        db: Database instance
+        notebook_runner: NotebookRunner instance
+        scorer: Scorer instance
+        username: Username of submitter
+        submission_id: ID of the submission row to update
+        submission_path: Path to the saved notebook
+
+    Returns:
+        Dictionary with 'success', 'score', 'rank', 'error_message' and 'execution_time'
+    """
+    logger.info(f"Starting execution for submission ID {submission_id}")
+    result = notebook_runner.execute_notebook_safe(submission_path)
+
+    if not result['success']:
+        logger.error(f"Execution failed for submission ID {submission_id}: {result['error_message']}")
+        db.update_submission(
+            submission_id,
+            status="failed",
+            error_message=result['error_message']
+        )
+        return {
+            'success': False,
+            'score': None,
+            'rank': None,
+            'error_message': f"Execution failed: {result['error_message']}",
+            'execution_time': result['execution_time']
+        }
+
+    logger.info(f"Execution successful for submission ID {submission_id} in {result['execution_time']:.2f}s")
+
+    # Score the notebook
+    score, scoring_error = scorer.score_notebook(result['output_path'])
+
+    # Check if scoring failed (0.0 with error message)
+    if scoring_error:
+        logger.error(f"Scoring failed for submission ID {submission_id}: {scoring_error}")
+        db.update_submission(
+            submission_id,
+            status="failed",
+            error_message=scoring_error
+        )
+        return {
+            'success': False,
+            'score': None,
+            'rank': None,
+            'error_message': f"Submission failed: {scoring_error}",
+            'execution_time': result['execution_time']
+        }
+
+    # Record the score, update the leaderboard and get the new rank in one transaction
+    rank = db.finalize_submission(submission_id, username, score)
+    logger.info(f"Submission ID {submission_id} completed with score {score}, rank #{rank}")
+
+    return {
+        'success': True,
+        'score': score,
+        'rank': rank,
+        'error_message': None,
+        'execution_time': result['execution_time']
+    }
+
+
+@st.fragment(run_every="2s")
+def show_pending_submission():
+    """Poll the background job for the current session's submission.
+
+    Runs as a fragment, so only this block reruns while the notebook is
+    executing; the whole page reruns once, when the job finishes.
+    """
+
+    pending = st.session_state.pending_submission
+    future = pending['future']
 
-        logger.info(f"Validation passed for '{username}'")
-        st.success("Validation passed!")
-
-        # Save to submissions directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        submission_filename = f"{username}_{timestamp}.ipynb"
-        submission_path = os.path.join("data/submissions", submission_filename)
-        shutil.copy(tmp_path, submission_path)
-        logger.info(f"Saved submission to: {submission_path}")
-
-        # Add to database
-        submission_id = st.session_state.db.add_submission(
-            username=username,
-            notebook_path=submission_path,
-            status="pending"
+    if not future.done():
+        st.info(f"Executing submission #{pending['id']}... This may take a few minutes.")
+        return
+
+    st.session_state.pending_submission = None
+
+    try:
+        st.session_state.submission_result = future.result()
+
+    except Exception as e:
+        logger.error(f"Background job for submission ID {pending['id']} raised: {e}", exc_info=True)
+        st.session_state.db.update_submission(
+            pending['id'],
+            status="failed",
+            error_message=str(e)
         )
+        st.session_state.submission_result = {
+            'success': False,
+            'error_message': f"Submission failed: {e}"
+        }
 
-        # Execute notebook
-        with st.spinner("Executing notebook... This may take a few minutes."):
-
-            st.session_state.db.update_submission(submission_id, "running")
-            logger.info(f"Starting execution for submission ID {submission_id}")
-            result = st.session_state.notebook_runner.execute_notebook_safe(submission_path)
-
-            if result['success']:
-                logger.info(f"Execution successful for submission ID {submission_id} in {result['execution_time']:.2f}s")
-                st.success(f"Execution completed in {result['execution_time']:.2f} seconds")
-
-                # Score the notebook
-                with st.spinner("Scoring your submission..."):
-                    score, scoring_error = st.session_state.scorer.score_notebook(
-                        result['output_path']
-                    )
-
-                    # Check if scoring failed (0.0 with error message)
-                    if scoring_error:
-                        logger.error(f"Scoring failed for submission ID {submission_id}: {scoring_error}")
-                        st.error(f"Submission failed: {scoring_error}")
-                        
-                        st.session_state.db.update_submission(
-                            submission_id,
-                            status="failed",
-                            error_message=scoring_error
-                        )
-                    else:
-                        # Update database with successful score
-                        st.session_state.db.update_submission(
-                            submission_id,
-                            status="completed",
-                            score=score
-                        )
+    st.rerun()
 
-                        st.session_state.db.update_leaderboard(username, submission_id, score)
-                        
-                        logger.info(f"Submission ID {submission_id} completed with score {score}")
-                        
-                        # Display results
-                        st.balloons()
-                        st.success("Submission successful!")
 
-                        col1, col2 = st.columns(2)
+def show_submission_result(result: dict):
+    """Display the outcome of a finished submission.
 
-                        with col1:
-                            st.metric("Your Score", f"{score:.2f}")
+    Args:
+        result: Dictionary returned by run_and_score
+    """
 
-                        with col2:
-                            rank_info = st.session_state.db.get_user_rank(username)
+    if not result['success']:
+        st.error(result['error_message'])
+        return
 
-                            if rank_info:
-                                rank, _ = rank_info
-                                st.metric("Your Rank", f"#{rank}")
-                                logger.info(f"User '{username}' ranked #{rank} with score {score}")
-            else:
+    st.success(f"Execution completed in {result['execution_time']:.2f} seconds")
 
-                logger.error(f"Execution failed for submission ID {submission_id}: {result['error_message']}")
-                st.error(f"Execution failed: {result['error_message']}")
+    # Display results
+    st.balloons()
+    st.success("Submission successful!")
 
-                st.session_state.db.update_submission(
-                    submission_id,
-                    status="failed",
-                    error_message=result['error_message']
-                )
+    col1, col2 = st.columns(2)
 
-    finally:
-        # Clean up temporary file
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
-            logger.debug(f"Cleaned up temporary file: {tmp_path}")
+    with col1:
+        st.metric("Your Score", f"{result['score']:.2f}")
+
+    with col2:
+        st.metric("Your Rank", f"#{result['rank']}")
 
 
 def show_leaderboard_page():
@@ -307,15 +472,15 @@ def show_leaderboard_page():
     st.markdown('<div class="sub-header">Leaderboard</div>', unsafe_allow_html=True)
 
     # Get leaderboard data
-    df = st.session_state.leaderboard_manager.get_leaderboard_df()
+    df_display = cached_leaderboard_display_df(
+        st.session_state.leaderboard_manager,
+        st.session_state.db.version
+    )
 
-    if df.empty:
+    if df_display.empty:
         st.info("No submissions yet. Be the first to submit!")
 
     else:
-        # Add medals to top 3
-        df_display = st.session_state.leaderboard_manager.format_leaderboard_for_display(df)
-
         # Display leaderboard
         st.dataframe(
             df_display,
@@ -331,7 +496,11 @@ def show_leaderboard_page():
 
         # Recent activity
         st.markdown("### Recent Submissions")
-        recent_df = st.session_state.leaderboard_manager.get_recent_submissions_df(limit=10)
+        recent_df = cached_recent_submissions_df(
+            st.session_state.leaderboard_manager,
+            st.session_state.db.version,
+            limit=10
+        )
         st.dataframe(recent_df, hide_index=True)
 
 
@@ -344,42 +513,40 @@ def show_stats_page():
 
     if username:
         if st.button("View Stats"):
-            stats = st.session_state.leaderboard_manager.get_user_stats(username)
+            stats = cached_user_stats(
+                st.session_state.leaderboard_manager,
+                st.session_state.db.version,
+                username
+            )
 
             if not stats:
                 st.warning(f"No submissions found for user '{username}'")
 
             else:
                 # Display stats in columns
-                col1, col2, col3, col4 = st.columns(4)
-
-                with col1:
-                    st.markdown('<div class="stat-box">', unsafe_allow_html=True)
-                    st.markdown(f'<div class="stat-value">#{stats["rank"]}</div>', unsafe_allow_html=True)
-                    st.markdown('<div class="stat-label">Current Rank</div>', unsafe_allow_html=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                with col2:
-                    st.markdown('<div class="stat-box">', unsafe_allow_html=True)
-                    st.markdown(f'<div class="stat-value">{stats["best_score"]:.2f}</div>', unsafe_allow_html=True)
-                    st.markdown('<div class="stat-label">Best Score</div>', unsafe_allow_html=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                with col3:
-                    st.markdown('<div class="stat-box">', unsafe_allow_html=True)
-                    st.markdown(f'<div class="stat-value">{stats["total_submissions"]}</div>', unsafe_allow_html=True)
-                    st.markdown('<div class="stat-label">Total Submissions</div>', unsafe_allow_html=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                with col4:
-                    st.markdown('<div class="stat-box">', unsafe_allow_html=True)
-                    st.markdown(f'<div class="stat-value">{stats["average_score"]:.2f}</div>', unsafe_allow_html=True)
-                    st.markdown('<div class="stat-label">Average Score</div>', unsafe_allow_html=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
+                stat_boxes = [
+                    (f'#{stats["rank"]}', "Current Rank"),
+                    (f'{stats["best_score"]:.2f}', "Best Score"),
+                    (f'{stats["total_submissions"]}', "Total Submissions"),
+                    (f'{stats["average_score"]:.2f}', "Average Score")
+                ]
+
+                # One markdown element per box so the wrapper div actually contains its children
+                for col, (value, label) in zip(st.columns(4), stat_boxes):
+                    with col:
+                        st.markdown(
+                            f'<div class="stat-box"><div class="stat-value">{value}</div>'
+                            f'<div class="stat-label">{label}</div></div>',
+                            unsafe_allow_html=True
+                        )
 
                 # Submission history
                 st.markdown("### Submission History")
-                history_df = st.session_state.leaderboard_manager.get_submission_history_df(username)
+                history_df = cached_submission_history_df(
+                    st.session_state.leaderboard_manager,
+                    st.session_state.db.version,
+                    username
+                )
                 st.dataframe(history_df, hide_index=True)
 
 
@@ -478,7 +645,7 @@ def show_admin_page():
     st.markdown("### Manage Submissions")
     
     # Get all submissions
-    all_submissions = st.session_state.db.get_all_submissions()
+    all_submissions = st.session_state.db.get_submission_summaries()
     
     if not all_submissions:
         st.info("No submissions in the database.")
@@ -488,13 +655,11 @@ def show_admin_page():
     st.markdown(f"**Total Submissions:** {len(all_submissions)}")
     
     # Convert to DataFrame for display
-    import pandas as pd
     df = pd.DataFrame(all_submissions)
     
     # Format the display
     display_df = df[['id', 'username', 'score', 'status', 'timestamp']].copy()
-    display_df['score'] = display_df['score'].apply(lambda x: f"{x:.2f}" if x is not None else "N/A")
-    display_df['timestamp'] = pd.to_datetime(display_df['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
+    display_df['timestamp'] = format_timestamps(display_df['timestamp'])
     
     st.dataframe(
         display_df,
@@ -502,7 +667,7 @@ def show_admin_page():
         column_config={
             "id": st.column_config.NumberColumn("ID", width="small"),
             "username": st.column_config.TextColumn("Username", width="medium"),
-            "score": st.column_config.TextColumn("Score", width="small"),
+            "score": st.column_config.NumberColumn("Score", format="%.2f", width="small"),
             "status": st.column_config.TextColumn("Status", width="small"),
             "timestamp": st.column_config.TextColumn("Timestamp", width="medium"),
         },
@@ -512,10 +677,6 @@ def show_admin_page():
     st.markdown("---")
     st.markdown("### Remove Submission")
     
-    # Initialize session state for removal confirmation
-    if 'confirm_removal_id' not in st.session_state:
-        st.session_state.confirm_removal_id = None
-    
     # Submission removal
     col1, col2 = st.columns([2, 1])
     
@@ -532,60 +693,60 @@ def show_admin_page():
         st.markdown("")
         st.markdown("")
         if st.button("Remove Submission", type="secondary", key="remove_btn"):
-            # Store the ID to confirm
-            st.session_state.confirm_removal_id = submission_id_input
-            st.rerun()
+            submission_id = int(submission_id_input)
+            submission = st.session_state.db.get_submission(submission_id)
+
+            if not submission:
+                st.error(f"Submission ID {submission_id} not found.")
+                logger.warning(f"Attempt to remove non-existent submission ID {submission_id}")
+            else:
+                confirm_removal_dialog(submission)
+
+
+@st.dialog("Confirm Removal")
+def confirm_removal_dialog(submission: dict):
+    """Ask the admin to confirm removing a submission.
+
+    Runs as a modal, so clicking its buttons does not rebuild the admin table.
     
-    # Show confirmation dialog if a removal is pending
-    if st.session_state.confirm_removal_id is not None:
-        submission_id = st.session_state.confirm_removal_id
-        
-        # Get submission details
-        submission = st.session_state.db.get_submission(submission_id)
-        
-        if not submission:
-            st.error(f"Submission ID {submission_id} not found.")
-            logger.warning(f"Attempt to remove non-existent submission ID {submission_id}")
-            st.session_state.confirm_removal_id = None
-        else:
-            username = submission['username']
-            score = submission['score']
-            status = submission['status']
-            
-            # Show confirmation
-            st.warning(f"""⚠️ Confirm Removal
+    Args:
+        submission: Submission row to remove
+    """
+    submission_id = submission['id']
+    score = submission['score']
+
+    st.warning(f"""⚠️ Confirm Removal
             
 **Submission ID:** {submission_id}  
-**Username:** {username}  
+**Username:** {submission['username']}  
 **Score:** {score if score is not None else 'N/A'}  
-**Status:** {status}
+**Status:** {submission['status']}
 
 This action cannot be undone.
-            """)
-            
-            col1, col2, col3 = st.columns([1, 1, 2])
-            
-            with col1:
-                if st.button("✓ Yes, Remove", type="primary", key=f"confirm_remove_{submission_id}"):
-                    logger.info(f"Admin confirmed removal of submission ID {submission_id}")
-                    try:
-                        removed = st.session_state.db.remove_submission(submission_id)
-                        st.session_state.confirm_removal_id = None
-                        if removed:
-                            st.success(f"✓ Successfully removed submission ID {submission_id}")
-                        else:
-                            st.error(f"Submission ID {submission_id} not found.")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error removing submission: {e}")
-                        logger.error(f"Error removing submission ID {submission_id}: {e}", exc_info=True)
-                        st.session_state.confirm_removal_id = None
-            
-            with col2:
-                if st.button("✗ Cancel", key=f"cancel_remove_{submission_id}"):
-                    st.session_state.confirm_removal_id = None
-                    st.info("Removal cancelled.")
-                    st.rerun()
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("✓ Yes, Remove", type="primary", key=f"confirm_remove_{submission_id}"):
+            logger.info(f"Admin confirmed removal of submission ID {submission_id}")
+            try:
+                removed = st.session_state.db.remove_submission(submission_id)
+            except Exception as e:
+                st.error(f"Error removing submission: {e}")
+                logger.error(f"Error removing submission ID {submission_id}: {e}", exc_info=True)
+                return
+
+            if not removed:
+                st.error(f"Submission ID {submission_id} not found.")
+                return
+
+            # Full rerun closes the dialog and refreshes the admin table
+            st.rerun()
+    
+    with col2:
+        if st.button("✗ Cancel", key=f"cancel_remove_{submission_id}"):
+            st.rerun()
 
 
 if __name__ == "__main__":
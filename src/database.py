@@ -1,19 +1,54 @@
 """Database handler for leaderboard application using SQLite."""
 
+import atexit
+import json
 import sqlite3
 import os
+import queue
 import shutil
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from contextlib import contextmanager
 
+from .hub_sync import HubSyncWorker
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Per-connection tuning applied to every connection we open. WAL mode itself
+# is persistent in the database file and is set once in Database.__init__.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Maximum number of idle connections kept open per database file.
+POOL_SIZE = 4
+
+# Per-connection cache of compiled statements (sqlite3 default is 128).
+CACHED_STATEMENTS = 256
+
 
 class Database:
     """Manages SQLite database operations for submissions and leaderboard."""
+
+    # Process-wide write counters keyed by database path. Bumped after every
+    # committed write so callers can cheaply tell when cached reads are stale.
+    _write_versions: Dict[str, int] = {}
+
+    # Process-wide pools of idle, pre-configured connections keyed by path.
+    _pools: Dict[str, queue.LifoQueue] = {}
+    # Separate pools of query_only connections used by the read accessors.
+    _read_pools: Dict[str, queue.LifoQueue] = {}
+    _pools_lock = threading.Lock()
+
+    # Process-wide background Hub uploaders keyed by path.
+    _hub_workers: Dict[str, HubSyncWorker] = {}
     
     def __init__(self, db_path: str = "data/leaderboard.db"):
         """Initialize database connection.
@@ -31,8 +66,20 @@ class Database:
         else:
             logger.info("HuggingFace Hub persistence disabled (HF_TOKEN/HF_DB_REPO not set)")
         self._ensure_db_directory()
-        self._pull_from_hub()
-        self._remove_if_invalid()
+        with self._pools_lock:
+            # Only the first instance for a path may replace the file; later
+            # instances share pooled connections that already have it open.
+            if self.db_path not in self._pools:
+                self._pull_from_hub()
+                self._remove_if_invalid()
+                self._enable_incremental_vacuum()
+                self._enable_wal()
+                self._pools[self.db_path] = queue.LifoQueue(maxsize=POOL_SIZE)
+                self._read_pools[self.db_path] = queue.LifoQueue(maxsize=POOL_SIZE)
+            if self._hub_enabled and self.db_path not in self._hub_workers:
+                self._hub_workers[self.db_path] = HubSyncWorker(self._upload_to_hub)
+        self._pool = self._pools[self.db_path]
+        self._read_pool = self._read_pools[self.db_path]
         self._create_tables()
         logger.info("Database initialized successfully")
     
@@ -65,6 +112,61 @@ class Database:
                 "(possibly a Git LFS pointer). Removing it so a fresh database can be created."
             )
             os.remove(self.db_path)
+            self._remove_wal_files()
+
+    def _remove_wal_files(self):
+        """Remove WAL sidecar files that no longer match the main database file."""
+        for suffix in ("-wal", "-shm"):
+            sidecar = self.db_path + suffix
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+                logger.debug(f"Removed stale SQLite sidecar file: {sidecar}")
+
+    def _enable_incremental_vacuum(self):
+        """Switch the database to incremental auto-vacuum.
+
+        Lets maintenance() hand pages freed by deleted submissions back to the
+        filesystem. Existing files only pick up the new mode after a VACUUM,
+        so that is run once here; on a new, empty file it is instant.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            # 2 = INCREMENTAL
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+                logger.info("Enabled incremental auto-vacuum")
+        finally:
+            conn.close()
+
+    def _enable_wal(self):
+        """Switch the database to write-ahead logging.
+
+        WAL lets readers (sidebar stats, leaderboard page) proceed while a
+        submission is being written. The setting is stored in the database
+        file, so it only needs to be applied once.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            logger.debug(f"SQLite journal mode: {mode}")
+        finally:
+            conn.close()
+
+    def maintenance(self):
+        """Reclaim free pages and refresh query planner statistics."""
+        with self._get_connection() as conn:
+            # incremental_vacuum frees one page per step; executescript steps
+            # each statement to completion, execute() would stop after one
+            conn.executescript("PRAGMA incremental_vacuum; PRAGMA optimize;")
+
+    def _checkpoint(self):
+        """Fold the WAL back into the main database file."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
 
     def _pull_from_hub(self):
         """Download database from HuggingFace Hub dataset repo on startup.
@@ -85,21 +187,34 @@ class Database:
                 force_download=True,
             )
             shutil.copy2(cached_path, self.db_path)
+            self._remove_wal_files()
             logger.info("Database pulled from Hub successfully")
         except Exception as e:
             # File may not exist yet on the Hub (fresh deployment) — that's fine.
             logger.info(f"Could not pull database from Hub (may be a fresh deployment): {e}")
 
     def _push_to_hub(self):
-        """Upload the local database file to HuggingFace Hub dataset repo.
+        """Schedule an upload of the local database file to the Hub dataset repo.
 
         Called automatically after every write operation when Hub is configured.
-        Errors are logged but never raised so that writes always succeed locally.
+        The upload runs on a background thread and bursts of writes are
+        coalesced into one upload, so writers never wait on the network.
         """
         if not self._hub_enabled:
             return
+        self._hub_workers[self.db_path].request_upload()
+
+    def _upload_to_hub(self):
+        """Upload the local database file to HuggingFace Hub dataset repo.
+
+        Errors are logged but never raised so that writes always succeed locally.
+        """
         try:
             from huggingface_hub import upload_file
+            # Keep the uploaded file compact, then fold committed writes that
+            # may still live in the WAL file into it.
+            self.maintenance()
+            self._checkpoint()
             logger.info(f"Pushing database to Hub: {self.hf_db_repo}")
             upload_file(
                 path_or_fileobj=self.db_path,
@@ -113,11 +228,45 @@ class Database:
         except Exception as e:
             logger.error(f"Failed to push database to Hub: {e}", exc_info=True)
     
+    def _bump_version(self):
+        """Record that the database contents changed."""
+        self._write_versions[self.db_path] = self._write_versions.get(self.db_path, 0) + 1
+
+    @property
+    def version(self) -> int:
+        """Write counter for this database path, incremented on every change."""
+        return self._write_versions.get(self.db_path, 0)
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open and configure a new database connection.
+
+        Args:
+            read_only: Refuse writes on this connection (PRAGMA query_only)
+        """
+        # Pooled connections may be handed to a different thread later on
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        return conn
+
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Context manager for database connections.
+
+        Borrows an idle connection from the pool (opening a new one if none
+        are free) and returns it to the pool afterwards.
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
         try:
             yield conn
             conn.commit()
@@ -126,7 +275,65 @@ class Database:
             logger.error(f"Database transaction failed, rolling back: {e}", exc_info=True)
             raise
         finally:
+            self._release(self._pool, conn)
+
+    @contextmanager
+    def _get_read_connection(self):
+        """Context manager for read-only queries.
+
+        Borrows from a separate pool of query_only connections, so readers
+        never hold a write transaction or take a writer's pooled connection.
+        Under WAL they read a consistent snapshot without blocking writers.
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect(read_only=True)
+        try:
+            yield conn
+        finally:
+            # End the implicit read snapshot before the connection is reused
+            conn.rollback()
+            self._release(self._read_pool, conn)
+
+    @staticmethod
+    def _release(pool: queue.LifoQueue, conn: sqlite3.Connection):
+        """Return a connection to its pool, closing it if the pool is full."""
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
             conn.close()
+
+    def close(self):
+        """Close all idle pooled connections for this database file."""
+        with self._pools_lock:
+            self._pools.pop(self.db_path, None)
+            self._read_pools.pop(self.db_path, None)
+        self._drain_pool(self._pool)
+        self._drain_pool(self._read_pool)
+
+    @staticmethod
+    def _drain_pool(pool: queue.LifoQueue):
+        """Close every idle connection in a pool."""
+        while True:
+            try:
+                pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    @classmethod
+    def close_all(cls):
+        """Close the pooled connections for every database file.
+
+        Registered with atexit so the last connection to each file closes
+        cleanly, which checkpoints and removes the WAL file.
+        """
+        with cls._pools_lock:
+            pools = list(cls._pools.values()) + list(cls._read_pools.values())
+            cls._pools.clear()
+            cls._read_pools.clear()
+        for pool in pools:
+            cls._drain_pool(pool)
     
     def _create_tables(self):
         """Create database tables if they don't exist."""
@@ -143,9 +350,16 @@ class Database:
                         notebook_path TEXT NOT NULL,
                         score REAL,
                         status TEXT NOT NULL,
-                        error_message TEXT
+                        error_message TEXT,
+                        notebook_hash TEXT
                     )
                 """)
+
+                # Databases created before notebook_hash existed need the column added
+                cursor.execute("PRAGMA table_info(submissions)")
+                if "notebook_hash" not in [row["name"] for row in cursor.fetchall()]:
+                    cursor.execute("ALTER TABLE submissions ADD COLUMN notebook_hash TEXT")
+                    logger.info("Added notebook_hash column to submissions table")
                 
                 # Leaderboard table
                 cursor.execute("""
@@ -160,17 +374,37 @@ class Database:
                 """)
                 
                 # Create indexes for better performance
+                # Serves per-user lookups and covers the best-score
+                # recalculation in remove_submission, so it also replaces the
+                # older username-only index
+                cursor.execute("DROP INDEX IF EXISTS idx_submissions_username")
                 cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_submissions_username 
-                    ON submissions(username)
+                    CREATE INDEX IF NOT EXISTS idx_submissions_user_status_score
+                    ON submissions(username, status, score DESC, id)
                 """)
+                # Covers the recent-submissions query, so it also replaces the
+                # older timestamp-only index
+                cursor.execute("DROP INDEX IF EXISTS idx_submissions_timestamp")
                 cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_submissions_timestamp 
-                    ON submissions(timestamp)
+                    CREATE INDEX IF NOT EXISTS idx_submissions_recent
+                    ON submissions(timestamp DESC, username, score, status)
                 """)
                 cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_leaderboard_score 
-                    ON leaderboard(best_score DESC)
+                    CREATE INDEX IF NOT EXISTS idx_submissions_username_hash
+                    ON submissions(username, notebook_hash)
+                """)
+                # Partial index: only the few in-flight rows are indexed, so
+                # finding stuck submissions never scans the whole table
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_submissions_running
+                    ON submissions(status) WHERE status = 'running'
+                """)
+                # Covers the leaderboard listing and rank lookups, so it also
+                # replaces the older score-only index
+                cursor.execute("DROP INDEX IF EXISTS idx_leaderboard_score")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_leaderboard_cover
+                    ON leaderboard(best_score DESC, username, submission_count, last_updated)
                 """)
                 
                 logger.debug("Database tables and indexes created/verified")
@@ -184,7 +418,8 @@ class Database:
         notebook_path: str,
         status: str = "pending",
         score: Optional[float] = None,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        notebook_hash: Optional[str] = None
     ) -> int:
         """Add a new submission to the database.
         
@@ -194,6 +429,7 @@ class Database:
             status: Submission status (pending, running, completed, failed)
             score: Score if available
             error_message: Error message if failed
+            notebook_hash: SHA-256 hex digest of the notebook file
             
         Returns:
             Submission ID
@@ -201,14 +437,87 @@ class Database:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT INTO submissions (username, timestamp, notebook_path, score, status, error_message)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (username, datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'), notebook_path, score, status, error_message))
+                INSERT INTO submissions (username, timestamp, notebook_path, score, status, error_message, notebook_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (username, datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'), notebook_path, score, status, error_message, notebook_hash))
             submission_id = cursor.lastrowid
             logger.info(f"Added submission ID {submission_id} for user '{username}' with status '{status}'")
+        self._bump_version()
         self._push_to_hub()
         return submission_id
     
+    def add_submissions_bulk(self, submissions: List[Dict]) -> int:
+        """Insert many submissions in one transaction and rebuild affected leaderboard entries.
+
+        Meant for importing or replaying past runs: the INSERT is prepared
+        once and the whole batch is committed with a single fsync.
+
+        Args:
+            submissions: Dictionaries with username, notebook_path and
+                optionally timestamp, status, score, error_message and
+                notebook_hash. A missing status defaults to 'completed'
+                (add_submission defaults to 'pending'), so rows without one
+                count towards the leaderboard; a missing timestamp defaults
+                to the time of the call
+
+        Returns:
+            Number of submissions inserted
+        """
+        if not submissions:
+            return 0
+
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
+        rows = [
+            (
+                sub['username'],
+                sub.get('timestamp') or now,
+                sub['notebook_path'],
+                sub.get('score'),
+                sub.get('status', 'completed'),
+                sub.get('error_message'),
+                sub.get('notebook_hash'),
+            )
+            for sub in submissions
+        ]
+        usernames = sorted({row[0] for row in rows})
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany("""
+                INSERT INTO submissions (username, timestamp, notebook_path, score, status, error_message, notebook_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+            # Recompute each affected user's entry from all of their
+            # completed submissions, old and new
+            cursor.execute("""
+                INSERT INTO leaderboard (username, best_score, best_submission_id, last_updated, submission_count)
+                SELECT username, score, id, ?, count
+                FROM (
+                    SELECT
+                        id,
+                        username,
+                        score,
+                        COUNT(*) OVER (PARTITION BY username) AS count,
+                        ROW_NUMBER() OVER (PARTITION BY username ORDER BY score DESC, id) AS rn
+                    FROM submissions
+                    WHERE status = 'completed'
+                        AND username IN (SELECT value FROM json_each(?))
+                )
+                WHERE rn = 1 AND score IS NOT NULL
+                ON CONFLICT(username) DO UPDATE SET
+                    best_score = excluded.best_score,
+                    best_submission_id = excluded.best_submission_id,
+                    last_updated = excluded.last_updated,
+                    submission_count = excluded.submission_count
+            """, (now, json.dumps(usernames)))
+            logger.info(f"Bulk inserted {len(rows)} submissions for {len(usernames)} user(s)")
+
+        self._bump_version()
+        self._push_to_hub()
+        return len(rows)
+    
     def update_submission(
         self,
         submission_id: int,
@@ -234,8 +543,37 @@ class Database:
             logger.info(f"Updated submission ID {submission_id}: status='{status}', score={score}")
             if error_message:
                 logger.warning(f"Submission ID {submission_id} error: {error_message}")
+        self._bump_version()
         self._push_to_hub()
-    
+
+    def fail_running_submissions(self, error_message: str) -> List[Dict]:
+        """Mark every submission still in 'running' status as failed.
+
+        Uses a single UPDATE, so all stuck submissions are changed in one
+        transaction with one Hub upload.
+
+        Args:
+            error_message: Error message to record on each submission
+
+        Returns:
+            The updated submissions (id, username, timestamp), ordered by ID
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE submissions
+                SET status = 'failed', error_message = ?
+                WHERE status = 'running'
+                RETURNING id, username, timestamp
+            """, (error_message,))
+            updated = sorted((dict(row) for row in cursor), key=lambda row: row['id'])
+
+        if updated:
+            logger.warning(f"Marked {len(updated)} running submission(s) as failed: {error_message}")
+            self._bump_version()
+            self._push_to_hub()
+        return updated
+
     def get_submission(self, submission_id: int) -> Optional[Dict]:
         """Get a submission by ID.
         
@@ -245,12 +583,33 @@ class Database:
         Returns:
             Submission data as dictionary or None
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM submissions WHERE id = ?", (submission_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    def find_submission_by_hash(self, username: str, notebook_hash: str) -> Optional[Dict]:
+        """Find the most recent completed submission of an identical notebook.
+
+        Args:
+            username: Username that submitted the notebook
+            notebook_hash: SHA-256 hex digest of the notebook file
+
+        Returns:
+            Submission data as dictionary or None
+        """
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM submissions
+                WHERE username = ? AND notebook_hash = ? AND status = 'completed'
+                ORDER BY id DESC
+                LIMIT 1
+            """, (username, notebook_hash))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    
     def get_user_submissions(self, username: str) -> List[Dict]:
         """Get all submissions for a user.
         
@@ -260,15 +619,63 @@ class Database:
         Returns:
             List of submission dictionaries
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM submissions 
                 WHERE username = ? 
                 ORDER BY timestamp DESC
             """, (username,))
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
     
+    def get_user_submission_aggregates(self, username: str) -> Dict:
+        """Get one user's submission counts and average score in a single query.
+
+        Args:
+            username: Username to aggregate submissions for
+
+        Returns:
+            Dictionary with total_submissions, successful_submissions,
+            failed_submissions and average_score (None when there are no scores)
+        """
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    COUNT(*) AS total_submissions,
+                    COALESCE(SUM(status = 'completed'), 0) AS successful_submissions,
+                    COALESCE(SUM(status = 'failed'), 0) AS failed_submissions,
+                    AVG(score) AS average_score
+                FROM submissions
+                WHERE username = ?
+            """, (username,))
+            return dict(cursor.fetchone())
+    
+    def _apply_leaderboard_update(self, cursor: sqlite3.Cursor, username: str, submission_id: int, score: float):
+        """Insert or update a user's leaderboard row within an open transaction.
+        
+        Args:
+            cursor: Cursor on the connection holding the transaction
+            username: Username to update
+            submission_id: ID of the submission
+            score: Score achieved
+        """
+        # Insert new users; for existing users keep the higher score (higher is
+        # better - adjust if lower is better) and always bump the count
+        cursor.execute("""
+            INSERT INTO leaderboard (username, best_score, best_submission_id, last_updated, submission_count)
+            VALUES (?, ?, ?, ?, 1)
+            ON CONFLICT(username) DO UPDATE SET
+                best_score = MAX(best_score, excluded.best_score),
+                best_submission_id = CASE
+                    WHEN excluded.best_score > best_score THEN excluded.best_submission_id
+                    ELSE best_submission_id
+                END,
+                last_updated = excluded.last_updated,
+                submission_count = submission_count + 1
+        """, (username, score, submission_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')))
+        logger.info(f"Updated leaderboard for '{username}' with submission ID {submission_id} (score {score})")
+
     def update_leaderboard(self, username: str, submission_id: int, score: float):
         """Update leaderboard with new submission.
         
@@ -277,40 +684,40 @@ class Database:
             submission_id: ID of the submission
             score: Score achieved
         """
+        with self._get_connection() as conn:
+            self._apply_leaderboard_update(conn.cursor(), username, submission_id, score)
+        self._bump_version()
+        self._push_to_hub()
+
+    def finalize_submission(self, submission_id: int, username: str, score: float) -> int:
+        """Mark a submission completed, update the leaderboard and return the user's rank.
+
+        All three steps run in one ``BEGIN IMMEDIATE`` transaction, so the
+        returned rank reflects exactly this write.
+
+        Args:
+            submission_id: ID of the submission that was scored
+            username: Username that made the submission
+            score: Score achieved
+
+        Returns:
+            The user's current leaderboard rank
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Check if user exists in leaderboard
-            cursor.execute("SELECT best_score, submission_count FROM leaderboard WHERE username = ?", (username,))
-            row = cursor.fetchone()
-            
-            if row:
-                best_score, submission_count = row['best_score'], row['submission_count']
-                
-                # Update if new score is better (higher is better - adjust if lower is better)
-                if score > best_score:
-                    cursor.execute("""
-                        UPDATE leaderboard
-                        SET best_score = ?, best_submission_id = ?, last_updated = ?, submission_count = ?
-                        WHERE username = ?
-                    """, (score, submission_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'), submission_count + 1, username))
-                    logger.info(f"Updated leaderboard for '{username}': new best score {score} (was {best_score})")
-                else:
-                    # Just increment submission count
-                    cursor.execute("""
-                        UPDATE leaderboard
-                        SET last_updated = ?, submission_count = ?
-                        WHERE username = ?
-                    """, (datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'), submission_count + 1, username))
-                    logger.info(f"Updated submission count for '{username}': {submission_count + 1} submissions")
-            else:
-                # New user - insert into leaderboard
-                cursor.execute("""
-                    INSERT INTO leaderboard (username, best_score, best_submission_id, last_updated, submission_count)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (username, score, submission_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'), 1))
-                logger.info(f"Added '{username}' to leaderboard with score {score}")
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("""
+                UPDATE submissions
+                SET status = 'completed', score = ?, error_message = NULL
+                WHERE id = ?
+            """, (score, submission_id))
+            logger.info(f"Updated submission ID {submission_id}: status='completed', score={score}")
+            self._apply_leaderboard_update(cursor, username, submission_id, score)
+            cursor.execute("SELECT best_score FROM leaderboard WHERE username = ?", (username,))
+            rank = self._rank_of(cursor, username, cursor.fetchone()["best_score"])
+        self._bump_version()
         self._push_to_hub()
+        return rank
     
     def get_leaderboard(self, limit: Optional[int] = None) -> List[Dict]:
         """Get leaderboard rankings.
@@ -321,23 +728,57 @@ class Database:
         Returns:
             List of leaderboard entries sorted by score
         """
-        with self._get_connection() as conn:
+        # Rows arrive in rank order, so the rank is just the row position
+        return [
+            {'rank': rank, **dict(row)}
+            for rank, row in enumerate(self._fetch_leaderboard_rows(limit), start=1)
+        ]
+
+    def get_leaderboard_columns(self, limit: Optional[int] = None) -> Dict[str, list]:
+        """Get leaderboard rankings column by column.
+
+        Suited to building a DataFrame directly from columns, without
+        per-row dict construction and type inference.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            Dictionary mapping rank, username, best_score, submission_count
+            and last_updated to lists of values in rank order
+        """
+        rows = self._fetch_leaderboard_rows(limit)
+        names = ('username', 'best_score', 'submission_count', 'last_updated')
+        values = list(zip(*rows)) if rows else [()] * len(names)
+        columns = {'rank': list(range(1, len(rows) + 1))}
+        columns.update((name, list(column)) for name, column in zip(names, values))
+        return columns
+
+    def _fetch_leaderboard_rows(self, limit: Optional[int]) -> List[sqlite3.Row]:
+        """Fetch leaderboard rows in rank order.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            Rows with username, best_score, submission_count and last_updated
+        """
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
             query = """
                 SELECT 
-                    ROW_NUMBER() OVER (ORDER BY best_score DESC) as rank,
                     username,
                     best_score,
                     submission_count,
                     last_updated
                 FROM leaderboard
-                ORDER BY best_score DESC
+                ORDER BY best_score DESC, username
+                LIMIT ?
             """
-            if limit:
-                query += f" LIMIT {limit}"
-            
-            cursor.execute(query)
-            return [dict(row) for row in cursor.fetchall()]
+            # A negative LIMIT means no limit, so the SQL text never changes
+            # and the connection's statement cache can reuse it
+            cursor.execute(query, (limit or -1,))
+            return cursor.fetchall()
     
     def get_user_rank(self, username: str) -> Optional[Tuple[int, Dict]]:
         """Get rank and details for a specific user.
@@ -348,24 +789,81 @@ class Database:
         Returns:
             Tuple of (rank, user_data) or None if user not found
         """
-        leaderboard = self.get_leaderboard()
-        for entry in leaderboard:
-            if entry['username'] == username:
-                return entry['rank'], entry
-        return None
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT username, best_score, submission_count, last_updated
+                FROM leaderboard
+                WHERE username = ?
+            """, (username,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            entry = dict(row)
+            entry['rank'] = self._rank_of(cursor, username, entry['best_score'])
+            return entry['rank'], entry
+
+    @staticmethod
+    def _rank_of(cursor: sqlite3.Cursor, username: str, best_score: float) -> int:
+        """Compute a user's rank without materializing the leaderboard.
+
+        Counts the users ordered ahead of them (higher score, or same score
+        and earlier username - the same order get_leaderboard uses), which is
+        a range scan on idx_leaderboard_cover.
+
+        Args:
+            cursor: Cursor to run the query on
+            username: Username to rank
+            best_score: That user's best score
+
+        Returns:
+            1-based leaderboard rank
+        """
+        cursor.execute("""
+            SELECT 1 + COUNT(*) AS rank
+            FROM leaderboard
+            WHERE best_score > ? OR (best_score = ? AND username < ?)
+        """, (best_score, best_score, username))
+        return cursor.fetchone()["rank"]
     
     def clear_leaderboard(self):
-        """Clear all leaderboard and submission data. Use with caution!"""
+        """Clear all leaderboard and submission data. Use with caution!
+
+        Both tables are emptied together, so foreign key checks are switched
+        off for the duration: SQLite skips its truncate optimization (drop
+        all pages at once instead of deleting row by row) on tables that are
+        the parent of an enforced foreign key.
+        """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM leaderboard")
-            cursor.execute("DELETE FROM submissions")
+            # Has no effect inside a transaction, so set it before BEGIN
+            conn.execute("PRAGMA foreign_keys=OFF")
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute("DELETE FROM leaderboard")
+                cursor.execute("DELETE FROM submissions")
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'submissions'")
+                conn.commit()
+            except Exception:
+                # End the transaction first: the pragma below is ignored
+                # while one is open, which would leave checks off on a
+                # pooled connection
+                conn.rollback()
+                raise
+            finally:
+                conn.execute("PRAGMA foreign_keys=ON")
             logger.warning("Cleared all leaderboard and submission data")
+        self._bump_version()
         self._push_to_hub()
     
     def remove_submission(self, submission_id: int) -> bool:
         """Remove a submission and recalculate the affected user's leaderboard entry.
 
+        The delete and the leaderboard recalculation run in a single
+        ``BEGIN IMMEDIATE`` transaction so a concurrent submission cannot
+        interleave between them.
+
         Args:
             submission_id: ID of the submission to remove
 
@@ -374,38 +872,46 @@ class Database:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            # The leaderboard row may point at the submission being deleted
+            # until it is recalculated below, so check foreign keys at commit
+            cursor.execute("PRAGMA defer_foreign_keys=ON")
 
-            # Fetch the submission so we know the owner
-            cursor.execute("SELECT username FROM submissions WHERE id = ?", (submission_id,))
+            # Delete the submission and learn its owner in one statement
+            cursor.execute(
+                "DELETE FROM submissions WHERE id = ? RETURNING username",
+                (submission_id,)
+            )
             row = cursor.fetchone()
             if not row:
                 logger.warning(f"remove_submission: submission ID {submission_id} not found")
                 return False
 
             username = row["username"]
-            cursor.execute("DELETE FROM submissions WHERE id = ?", (submission_id,))
 
-            # Recalculate the leaderboard entry for this user
+            # Recalculate the leaderboard entry for this user from their
+            # remaining completed submissions
             cursor.execute("""
-                SELECT MAX(score) AS best_score, COUNT(*) AS count
-                FROM submissions
-                WHERE username = ? AND status = 'completed'
-            """, (username,))
-            result = cursor.fetchone()
+                UPDATE leaderboard
+                SET best_score = ranked.score,
+                    submission_count = ranked.count,
+                    best_submission_id = ranked.id,
+                    last_updated = ?
+                FROM (
+                    SELECT
+                        id,
+                        score,
+                        COUNT(*) OVER () AS count,
+                        ROW_NUMBER() OVER (ORDER BY score DESC, id) AS rn
+                    FROM submissions
+                    WHERE username = ? AND status = 'completed'
+                ) AS ranked
+                WHERE ranked.rn = 1
+                    AND ranked.score IS NOT NULL
+                    AND leaderboard.username = ?
+            """, (datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'), username, username))
 
-            if result["best_score"] is not None:
-                cursor.execute("""
-                    SELECT id FROM submissions
-                    WHERE username = ? AND score = ? AND status = 'completed'
-                    LIMIT 1
-                """, (username, result["best_score"]))
-                best_id = cursor.fetchone()["id"]
-                cursor.execute("""
-                    UPDATE leaderboard
-                    SET best_score = ?, submission_count = ?, best_submission_id = ?, last_updated = ?
-                    WHERE username = ?
-                """, (result["best_score"], result["count"], best_id,
-                      datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'), username))
+            if cursor.rowcount:
                 logger.info(
                     f"Removed submission ID {submission_id}; updated leaderboard for '{username}'"
                 )
@@ -415,9 +921,31 @@ class Database:
                     f"Removed submission ID {submission_id}; removed '{username}' from leaderboard"
                 )
 
+        self._bump_version()
         self._push_to_hub()
         return True
 
+    def get_recent_submissions(self, limit: int = 10) -> List[Dict]:
+        """Get the most recent submissions with only the columns shown in the UI.
+
+        Served entirely from the idx_submissions_recent covering index.
+
+        Args:
+            limit: Maximum number of submissions to return
+
+        Returns:
+            List of dictionaries with username, timestamp, score and status
+        """
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT username, timestamp, score, status
+                FROM submissions
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (limit,))
+            return [dict(row) for row in cursor]
+
     def get_all_submissions(self, limit: Optional[int] = None) -> List[Dict]:
         """Get all submissions across all users.
         
@@ -427,11 +955,64 @@ class Database:
         Returns:
             List of submission dictionaries
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
-            query = "SELECT * FROM submissions ORDER BY timestamp DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-            
-            cursor.execute(query)
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute(
+                "SELECT * FROM submissions ORDER BY timestamp DESC LIMIT ?",
+                (limit or -1,)
+            )
+            return [dict(row) for row in cursor]
+
+    def get_submission_summaries(self) -> List[Dict]:
+        """Get every submission with only the columns shown in the admin listing.
+
+        Skips notebook_path and error_message, which are long strings the
+        listing never displays.
+
+        Returns:
+            List of dictionaries with id, username, score, status and timestamp
+        """
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, username, score, status, timestamp
+                FROM submissions
+                ORDER BY timestamp DESC
+            """)
+            return [dict(row) for row in cursor]
+
+    def get_notebook_paths(self) -> Set[str]:
+        """Get the notebook path of every stored submission.
+
+        Returns:
+            Set of notebook paths, for constant-time "already stored" checks
+        """
+        with self._get_read_connection() as conn:
+            cursor = conn.execute("SELECT notebook_path FROM submissions")
+            return {row["notebook_path"] for row in cursor}
+
+    def get_statistics(self) -> Dict:
+        """Get aggregate submission statistics in a single query.
+
+        Returns:
+            Dictionary with total_submissions, total_users,
+            successful_submissions, failed_submissions and the
+            average/highest/lowest score (None when there are no scores)
+        """
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    COUNT(*) AS total_submissions,
+                    (SELECT COUNT(*) FROM leaderboard) AS total_users,
+                    COALESCE(SUM(status = 'completed'), 0) AS successful_submissions,
+                    COALESCE(SUM(status = 'failed'), 0) AS failed_submissions,
+                    AVG(score) AS average_score,
+                    MAX(score) AS highest_score,
+                    MIN(score) AS lowest_score
+                FROM submissions
+            """)
+            return dict(cursor.fetchone())
+
+
+atexit.register(Database.close_all)
@@ -0,0 +1,62 @@
+"""Background upload of the database file to HuggingFace Hub."""
+
+import atexit
+import threading
+import time
+from typing import Callable
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HubSyncWorker:
+    """Runs database uploads on a daemon thread, coalescing bursts of writes.
+
+    Every write marks the database as dirty; the worker waits briefly so a
+    burst of writes (e.g. a submission followed by its leaderboard update)
+    is shipped as a single upload instead of one upload per statement.
+    """
+
+    def __init__(self, upload: Callable[[], None], delay_seconds: float = 2.0):
+        """Start the worker thread.
+
+        Args:
+            upload: Function that uploads the database file
+            delay_seconds: Time to wait for further writes before uploading
+        """
+        self._upload = upload
+        self._delay_seconds = delay_seconds
+        self._pending = threading.Event()
+        self._upload_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="hub-sync", daemon=True)
+        self._thread.start()
+        # Daemon threads are killed at exit; don't drop a pending upload.
+        atexit.register(self.flush)
+
+    def request_upload(self):
+        """Schedule an upload without waiting for it."""
+        self._pending.set()
+
+    def flush(self):
+        """Upload now if a write is still waiting to be shipped."""
+        if self._pending.is_set():
+            self._do_upload()
+
+    def _run(self):
+        """Worker loop: wait for a request, let writes settle, then upload."""
+        while True:
+            self._pending.wait()
+            time.sleep(self._delay_seconds)
+            self._do_upload()
+
+    def _do_upload(self):
+        """Upload once, clearing the pending flag first so later writes re-arm it."""
+        with self._upload_lock:
+            if not self._pending.is_set():
+                return
+            self._pending.clear()
+            try:
+                self._upload()
+            except Exception as e:
+                logger.error(f"Background Hub upload failed: {e}", exc_info=True)
@@ -0,0 +1,183 @@
+"""Pool of pre-started Jupyter kernels for notebook execution."""
+
+import asyncio
+import atexit
+import queue
+import threading
+from typing import Dict, Optional, Tuple
+
+from jupyter_client.manager import AsyncKernelManager
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Imported in each warm kernel (into a throwaway namespace, so the
+# notebook's own namespace stays empty) to pre-load the heavy libraries
+# assignment notebooks use.
+PRELOAD_CODE = "exec('import numpy, pandas, sklearn', {})"
+
+# Same in-memory history file nbclient uses for the kernels it starts
+KERNEL_ARGUMENTS = ["--HistoryManager.hist_file=:memory:"]
+
+
+class PooledKernelManager(AsyncKernelManager):
+    """Kernel manager that remembers the clients created for its kernel.
+
+    papermill/nbclient leave the channels of a client they did not create
+    the kernel for open; tracking them lets the pool close them.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._clients = []
+
+    def client(self, **kwargs):
+        """Create a kernel client and remember it."""
+        kc = super().client(**kwargs)
+        self._clients.append(kc)
+        return kc
+
+    async def dispose(self):
+        """Close every client's channels and shut the kernel down."""
+        for kc in self._clients:
+            kc.stop_channels()
+        self._clients.clear()
+        if await self.is_alive():
+            await self.shutdown_kernel(now=True)
+
+
+class KernelPool:
+    """Keeps kernels started and warmed up ahead of time.
+
+    Each kernel runs exactly one notebook and is then shut down, so
+    submissions never share interpreter state. Whenever a kernel is handed
+    out, a replacement is started on a background thread.
+    """
+
+    def __init__(self, kernel_name: str, size: int = 1, startup_timeout: int = 60):
+        """Initialize the pool and start warming its kernels.
+
+        Args:
+            kernel_name: Name of the kernel spec to start
+            size: Number of warm kernels to keep ready
+            startup_timeout: Seconds to wait for a kernel to become ready
+        """
+        logger.info(f"Initializing KernelPool with kernel={kernel_name}, size={size}")
+        self.kernel_name = kernel_name
+        self.startup_timeout = startup_timeout
+        self._idle: queue.Queue = queue.Queue()
+        for _ in range(size):
+            self._refill()
+
+    def acquire(self) -> Optional[PooledKernelManager]:
+        """Take a warm kernel, if one is ready.
+
+        Returns:
+            Kernel manager with a running kernel, or None if no warm kernel
+            is ready (the caller should start a fresh one as usual)
+        """
+        while True:
+            try:
+                km = self._idle.get_nowait()
+            except queue.Empty:
+                logger.info("No warm kernel ready, falling back to a fresh kernel")
+                return None
+
+            self._refill()
+            if asyncio.run(km.is_alive()):
+                return km
+            logger.warning("Discarding dead warm kernel")
+            self.release(km)
+
+    def release(self, km: PooledKernelManager):
+        """Dispose of a kernel after it has run a notebook.
+
+        Args:
+            km: Kernel manager returned by acquire()
+        """
+        try:
+            asyncio.run(km.dispose())
+        except Exception as e:
+            logger.error(f"Error shutting down pooled kernel: {e}", exc_info=True)
+
+    def shutdown(self):
+        """Shut down every idle kernel."""
+        while True:
+            try:
+                self.release(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def _refill(self):
+        """Start one replacement kernel on a background thread."""
+        threading.Thread(target=self._start_kernel, name="kernel-pool", daemon=True).start()
+
+    def _start_kernel(self):
+        """Start a kernel, wait until it is ready and pre-load libraries."""
+        try:
+            km = asyncio.run(self._start_warm_kernel())
+            self._idle.put(km)
+            logger.debug("Warm kernel ready")
+        except Exception as e:
+            logger.error(f"Could not start warm kernel: {e}", exc_info=True)
+
+    async def _start_warm_kernel(self) -> PooledKernelManager:
+        """Start a kernel and run the pre-load code in it.
+
+        Returns:
+            Kernel manager with a ready kernel
+        """
+        km = PooledKernelManager(kernel_name=self.kernel_name)
+        await km.start_kernel(extra_arguments=KERNEL_ARGUMENTS)
+        kc = km.client()
+        try:
+            try:
+                kc.start_channels()
+                await kc.wait_for_ready(timeout=self.startup_timeout)
+                msg_id = kc.execute(PRELOAD_CODE, silent=True)
+                while True:
+                    reply = await kc.get_shell_msg(timeout=self.startup_timeout)
+                    if reply['parent_header'].get('msg_id') == msg_id:
+                        break
+            finally:
+                # Forget the warm-up client before any dispose() below, so
+                # only clients created by the notebook run are tracked
+                kc.stop_channels()
+                km._clients.remove(kc)
+        except Exception:
+            await km.dispose()
+            raise
+        return km
+
+
+# Process-wide pools keyed by (kernel name, size), shared by all sessions
+_pools: Dict[Tuple[str, int], KernelPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_kernel_pool(kernel_name: str, size: int = 1) -> KernelPool:
+    """Get the shared kernel pool for a kernel, creating it on first use.
+
+    Args:
+        kernel_name: Name of the kernel spec to start
+        size: Number of warm kernels to keep ready
+
+    Returns:
+        Shared KernelPool instance
+    """
+    with _pools_lock:
+        key = (kernel_name, size)
+        if key not in _pools:
+            _pools[key] = KernelPool(kernel_name, size)
+        return _pools[key]
+
+
+@atexit.register
+def shutdown_all():
+    """Shut down the idle kernels of every pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
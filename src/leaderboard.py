@@ -3,9 +3,47 @@
 from typing import Dict, Optional #, List
 # from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from src.database import Database
 
+# Display format for every timestamp column
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Username prefixes for the top three ranks
+MEDALS = {1: '🥇 ', 2: '🥈 ', 3: '🥉 '}
+
+
+def format_timestamps(values: pd.Series) -> pd.Series:
+    """Format a column of stored timestamps for display.
+
+    Parses the whole column in one vectorized call (ISO 8601, with repeated
+    values parsed once) and formats it with the C-level strftime path.
+
+    Args:
+        values: Timestamps as stored in the database
+
+    Returns:
+        Series of formatted strings, 'N/A' where a value could not be parsed
+    """
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce', cache=True)
+    return parsed.dt.strftime(TIMESTAMP_FORMAT).fillna('N/A')
+
+
+def round_scores(values: pd.Series) -> np.ndarray:
+    """Round a score column to 2 decimal places.
+
+    Works on the raw float array, which also copes with columns that are
+    all None (e.g. only failed submissions) and so have object dtype.
+
+    Args:
+        values: Scores, possibly containing None
+
+    Returns:
+        Float array of rounded scores with NaN for missing values
+    """
+    return np.round(values.to_numpy(dtype=float), 2)
+
 
 class LeaderboardManager:
     """Manages leaderboard operations and rankings."""
@@ -30,43 +68,28 @@ class LeaderboardManager:
             DataFrame with leaderboard data
         """
 
-        leaderboard_data = self.db.get_leaderboard(limit=limit)
+        leaderboard_data = self.db.get_leaderboard_columns(limit=limit)
 
-        if not leaderboard_data:
+        if not leaderboard_data['rank']:
             # Return empty DataFrame with correct columns
             return pd.DataFrame(columns=[
                 'Rank', 'Username', 'Best Score', 'Submissions', 'Last Updated'
             ])
 
-        # Convert to DataFrame
-        df = pd.DataFrame(leaderboard_data)
-
-        # Rename columns for display
-        df = df.rename(columns={
-            'rank': 'Rank',
-            'username': 'Username',
-            'best_score': 'Best Score',
-            'submission_count': 'Submissions',
-            'last_updated': 'Last Updated'
+        # Build the frame column by column with explicit dtypes
+        df = pd.DataFrame({
+            'Rank': np.asarray(leaderboard_data['rank'], dtype=np.int64),
+            'Username': np.asarray(leaderboard_data['username'], dtype=object),
+            'Best Score': np.asarray(leaderboard_data['best_score'], dtype=np.float64),
+            'Submissions': np.asarray(leaderboard_data['submission_count'], dtype=np.int64),
+            'Last Updated': np.asarray(leaderboard_data['last_updated'], dtype=object),
         })
 
-        # Format the Last Updated column - handle various datetime formats
-        try:
-            # Convert to datetime, handling various formats
-            dt_series = pd.to_datetime(df['Last Updated'], errors='coerce')
-            # Format non-null values, keep null values as empty string
-            df['Last Updated'] = dt_series.apply(
-                lambda x: x.strftime('%Y-%m-%d %H:%M:%S') if pd.notna(x) else 'N/A'
-            )
-        except Exception:
-            # If conversion fails, just convert to string
-            df['Last Updated'] = df['Last Updated'].astype(str)
+        # Format the Last Updated column
+        df['Last Updated'] = format_timestamps(df['Last Updated'])
 
         # Round the score to 2 decimal places
-        df['Best Score'] = df['Best Score'].round(2)
-
-        # Select and order columns
-        df = df[['Rank', 'Username', 'Best Score', 'Submissions', 'Last Updated']]
+        df['Best Score'] = round_scores(df['Best Score'])
 
         return df
 
@@ -88,24 +111,17 @@ class LeaderboardManager:
 
         rank, user_data = result
 
-        # Get submission history
-        submissions = self.db.get_user_submissions(username)
-
-        # Calculate stats
-        total_submissions = len(submissions)
-        successful_submissions = len([s for s in submissions if s['status'] == 'completed'])
-        failed_submissions = len([s for s in submissions if s['status'] == 'failed'])
-
-        scores = [s['score'] for s in submissions if s['score'] is not None]
-        avg_score = sum(scores) / len(scores) if scores else 0
+        # Aggregate the submission history in SQL
+        aggregates = self.db.get_user_submission_aggregates(username)
+        avg_score = aggregates['average_score'] or 0
 
         return {
             'username': username,
             'rank': rank,
             'best_score': user_data['best_score'],
-            'total_submissions': total_submissions,
-            'successful_submissions': successful_submissions,
-            'failed_submissions': failed_submissions,
+            'total_submissions': aggregates['total_submissions'],
+            'successful_submissions': aggregates['successful_submissions'],
+            'failed_submissions': aggregates['failed_submissions'],
             'average_score': round(avg_score, 2),
             'last_updated': user_data['last_updated']
         }
@@ -127,28 +143,33 @@ class LeaderboardManager:
                 'ID', 'Timestamp', 'Score', 'Status', 'Error'
             ])
 
-        df = pd.DataFrame(submissions)
-
-        # Select and rename columns
-        df = df[['id', 'timestamp', 'score', 'status', 'error_message']]
-        df = df.rename(columns={
+        columns = {
             'id': 'ID',
             'timestamp': 'Timestamp',
             'score': 'Score',
             'status': 'Status',
             'error_message': 'Error'
-        })
+        }
+
+        # Select and rename columns
+        df = pd.DataFrame(submissions, columns=list(columns))
+        df.rename(columns=columns, inplace=True)
 
         # Format timestamp
-        df['Timestamp'] = pd.to_datetime(df['Timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
+        df['Timestamp'] = format_timestamps(df['Timestamp'])
 
         # Round score
-        df['Score'] = df['Score'].round(2)
+        df['Score'] = round_scores(df['Score'])
+
+        # Only a handful of distinct statuses
+        df['Status'] = df['Status'].astype('category')
 
-        # Truncate error messages
-        df['Error'] = df['Error'].apply(
-            lambda x: (x[:100] + '...') if x and len(str(x)) > 100 else x
-        )
+        # Truncate error messages (missing messages stay None); most
+        # histories have nothing to truncate, so skip the slicing then
+        errors = df['Error']
+        too_long = errors.str.len() > 100
+        if too_long.any():
+            df['Error'] = errors.where(~too_long, errors.str.slice(0, 100) + '...')
 
         return df
 
@@ -163,29 +184,33 @@ class LeaderboardManager:
             DataFrame with recent submissions
         """
 
-        submissions = self.db.get_all_submissions(limit=limit)
+        submissions = self.db.get_recent_submissions(limit=limit)
 
         if not submissions:
             return pd.DataFrame(columns=[
                 'Username', 'Timestamp', 'Score', 'Status'
             ])
 
-        df = pd.DataFrame(submissions)
-
-        # Select and rename columns
-        df = df[['username', 'timestamp', 'score', 'status']]
-        df = df.rename(columns={
+        columns = {
             'username': 'Username',
             'timestamp': 'Timestamp',
             'score': 'Score',
             'status': 'Status'
-        })
+        }
+
+        # Select and rename columns
+        df = pd.DataFrame(submissions, columns=list(columns))
+        df.rename(columns=columns, inplace=True)
 
         # Format timestamp
-        df['Timestamp'] = pd.to_datetime(df['Timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
+        df['Timestamp'] = format_timestamps(df['Timestamp'])
 
         # Round score
-        df['Score'] = df['Score'].round(2)
+        df['Score'] = round_scores(df['Score'])
+
+        # Low-cardinality columns: store codes plus a small dictionary
+        df['Username'] = df['Username'].astype('category')
+        df['Status'] = df['Status'].astype('category')
 
         return df
 
@@ -197,26 +222,10 @@ class LeaderboardManager:
             Dictionary with overall statistics
         """
 
-        all_submissions = self.db.get_all_submissions()
-        leaderboard = self.db.get_leaderboard()
+        stats = self.db.get_statistics()
 
-        total_submissions = len(all_submissions)
-        total_users = len(leaderboard)
-
-        successful = len([s for s in all_submissions if s['status'] == 'completed'])
-        failed = len([s for s in all_submissions if s['status'] == 'failed'])
-
-        scores = [s['score'] for s in all_submissions if s['score'] is not None]
-
-        stats = {
-            'total_submissions': total_submissions,
-            'total_users': total_users,
-            'successful_submissions': successful,
-            'failed_submissions': failed,
-            'average_score': round(sum(scores) / len(scores), 2) if scores else 0,
-            'highest_score': round(max(scores), 2) if scores else 0,
-            'lowest_score': round(min(scores), 2) if scores else 0
-        }
+        for key in ('average_score', 'highest_score', 'lowest_score'):
+            stats[key] = round(stats[key], 2) if stats[key] is not None else 0
 
         return stats
 
@@ -234,18 +243,9 @@ class LeaderboardManager:
         if df.empty:
             return df
 
-        # Add medal emojis for top 3
-        def add_medal(row):
-            if row['Rank'] == 1:
-                return f"🥇 {row['Username']}"
-            elif row['Rank'] == 2:
-                return f"🥈 {row['Username']}"
-            elif row['Rank'] == 3:
-                return f"🥉 {row['Username']}"
-            else:
-                return row['Username']
-
-        df['Username'] = df.apply(add_medal, axis=1)
+        # Add medal emojis for top 3 (one vectorized pass, no per-row Python calls)
+        medals = df['Rank'].map(MEDALS).fillna('')
+        df['Username'] = medals + df['Username'].astype(str)
 
         return df
 
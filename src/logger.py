@@ -1,14 +1,118 @@
 """Logging configuration for the leaderboard application."""
 
+import atexit
 import logging
 import os
+import queue
+import threading
 import warnings
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Dict
+
+
+# Formatters are stateless, so every handler shares these instances
+DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+SIMPLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+# One background listener per log directory (keyed by absolute path). It
+# owns the real file and console handlers, so logging calls only enqueue
+# the record and never wait on disk.
+_listeners: Dict[str, QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def _get_log_queue(log_dir: str) -> queue.SimpleQueue:
+    """Get the queue feeding the listener for a log directory, starting it if needed.
+    
+    Args:
+        log_dir: Directory to store log files
+        
+    Returns:
+        Queue consumed by the directory's listener thread
+    """
+    log_dir = os.path.abspath(log_dir)
+    
+    with _listeners_lock:
+        if log_dir in _listeners:
+            return _listeners[log_dir].queue
+        
+        # Create logs directory if it doesn't exist
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+        
+        # File handler for all logs (rotating, max 10MB per file, keep 5 files)
+        all_log_file = os.path.join(log_dir, 'leaderboard.log')
+        file_handler = RotatingFileHandler(
+            all_log_file,
+            maxBytes=10 * 1024 * 1024,  # 10MB
+            backupCount=5,
+            encoding='utf-8'
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(DETAILED_FORMATTER)
+        
+        # File handler for errors only (rotating, max 10MB per file, keep 5 files)
+        error_log_file = os.path.join(log_dir, 'errors.log')
+        error_handler = RotatingFileHandler(
+            error_log_file,
+            maxBytes=10 * 1024 * 1024,  # 10MB
+            backupCount=5,
+            encoding='utf-8'
+        )
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(DETAILED_FORMATTER)
+        
+        # Console handler for warnings and above
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.WARNING)
+        console_handler.setFormatter(SIMPLE_FORMATTER)
+        
+        listener = QueueListener(
+            queue.SimpleQueue(),
+            file_handler,
+            error_handler,
+            console_handler,
+            respect_handler_level=True
+        )
+        listener.start()
+        _listeners[log_dir] = listener
+        return listener.queue
+
+
+def flush_logs():
+    """Block until every record logged so far has been written out."""
+    with _listeners_lock:
+        for listener in _listeners.values():
+            # stop() drains the queue and joins the thread
+            listener.stop()
+            listener.start()
+
+
+def _stop_listeners():
+    """Write out queued records and stop the listener threads at exit."""
+    with _listeners_lock:
+        for listener in _listeners.values():
+            listener.stop()
+        _listeners.clear()
+
+
+atexit.register(_stop_listeners)
 
 
 def setup_logger(name: str, log_dir: str = "logs") -> logging.Logger:
-    """Set up a logger with rotating file handler and console output.
+    """Set up a logger that writes to rotating log files and the console.
+    
+    The logger itself only gets a QueueHandler; the file and console
+    handlers run on a background listener thread shared by every logger
+    that writes to the same directory.
     
     Args:
         name: Name of the logger (typically module name)
@@ -17,80 +121,40 @@ def setup_logger(name: str, log_dir: str = "logs") -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    Path(log_dir).mkdir(parents=True, exist_ok=True)
-    
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
     
-    # Avoid adding handlers multiple times
+    # Avoid adding handlers multiple times (and any filesystem work)
     if logger.handlers:
         return logger
     
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    simple_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # File handler for all logs (rotating, max 10MB per file, keep 5 files)
-    all_log_file = os.path.join(log_dir, 'leaderboard.log')
-    file_handler = RotatingFileHandler(
-        all_log_file,
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(detailed_formatter)
-    
-    # File handler for errors only (rotating, max 10MB per file, keep 5 files)
-    error_log_file = os.path.join(log_dir, 'errors.log')
-    error_handler = RotatingFileHandler(
-        error_log_file,
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(detailed_formatter)
-    
-    # Console handler for warnings and above
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.WARNING)
-    console_handler.setFormatter(simple_formatter)
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
-    logger.addHandler(console_handler)
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(QueueHandler(_get_log_queue(log_dir)))
     
     return logger
 
 
-def get_logger(name: str) -> logging.Logger:
+def get_logger(name: str, log_dir: str = "logs") -> logging.Logger:
     """Get or create a logger for a module.
     
     Args:
         name: Name of the logger (typically __name__)
+        log_dir: Directory to store log files
         
     Returns:
         Logger instance
     """
-    return setup_logger(name)
+    return setup_logger(name, log_dir)
 
 
-def configure_warnings_logging():
+def configure_warnings_logging(log_dir: str = "logs"):
     """Configure Python warnings to be captured by the logging system.
     
     This redirects all Python warnings (including DeprecationWarnings) to the
     logging system so they appear in log files instead of just stderr.
+    
+    Args:
+        log_dir: Directory to store log files
     """
     # Capture warnings with the logging system
     logging.captureWarnings(True)
@@ -98,25 +162,22 @@ def configure_warnings_logging():
     # Get the warnings logger and configure it
     warnings_logger = logging.getLogger('py.warnings')
     
-    # Create logs directory if it doesn't exist
-    Path('logs').mkdir(parents=True, exist_ok=True)
-    
-    # Add file handler for warnings
-    warnings_log_file = os.path.join('logs', 'leaderboard.log')
-    warnings_file_handler = RotatingFileHandler(
-        warnings_log_file,
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
-    )
-    warnings_file_handler.setLevel(logging.WARNING)
-    warnings_file_handler.setFormatter(logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    ))
-    
-    # Only add handler if not already present
+    # Only add handler if not already present (checked first so reruns
+    # don't open a file handle that is then thrown away)
     if not warnings_logger.handlers:
+        # Create logs directory if it doesn't exist
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+        
+        # Add file handler for warnings
+        warnings_log_file = os.path.join(log_dir, 'leaderboard.log')
+        warnings_file_handler = RotatingFileHandler(
+            warnings_log_file,
+            maxBytes=10 * 1024 * 1024,  # 10MB
+            backupCount=5,
+            encoding='utf-8'
+        )
+        warnings_file_handler.setLevel(logging.WARNING)
+        warnings_file_handler.setFormatter(DETAILED_FORMATTER)
         warnings_logger.addHandler(warnings_file_handler)
     
     # Make sure all warnings are shown (including DeprecationWarnings)
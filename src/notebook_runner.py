@@ -1,18 +1,61 @@
 """Notebook execution module using papermill."""
 
+import functools
+import json
 import os
+import time
 import traceback
-from datetime import datetime
-from typing import Optional, Tuple, Dict
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, Dict, List
 
 import nbformat
 import papermill as pm
 from jupyter_client.kernelspec import KernelSpecManager
 
+from .kernel_pool import get_kernel_pool
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Kernel names to use, in order of preference
+PREFERRED_KERNELS = ('python3', 'python', 'python2', 'ir')
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_kernel() -> Optional[str]:
+    """Detect the best available Python kernel.
+
+    Installed kernels don't change while the app runs, so the kernelspec
+    directory is only scanned once per process.
+    
+    Returns:
+        Name of the kernel to use, or None to use notebook's default
+    """
+    try:
+        ksm = KernelSpecManager()
+        available_kernels = ksm.get_all_specs()
+        logger.debug(f"Available kernels: {list(available_kernels.keys())}")
+        
+        for kernel in PREFERRED_KERNELS:
+            if kernel in available_kernels:
+                logger.info(f"Selected kernel: {kernel}")
+                return kernel
+        
+        # If none of the preferred kernels found, use the first available
+        if available_kernels:
+            first_kernel = list(available_kernels.keys())[0]
+            logger.info(f"Using first available kernel: {first_kernel}")
+            return first_kernel
+        
+        # Return None to let papermill use the notebook's kernel metadata
+        logger.warning("No kernels found, will use notebook's default kernel")
+        return None
+        
+    except Exception as e:
+        logger.error(f"Could not detect kernel: {e}", exc_info=True)
+        return None
+
 
 class TimeoutException(Exception):
     """Exception raised when notebook execution times out."""
@@ -23,59 +66,39 @@ class TimeoutException(Exception):
 class NotebookRunner:
     """Handles execution of Jupyter notebooks."""
 
-    def __init__(self, output_dir: str = "data/outputs", timeout_seconds: int = 300):
+    def __init__(
+        self,
+        output_dir: str = "data/outputs",
+        timeout_seconds: int = 300,
+        warm_kernels: int = 0
+    ):
         """Initialize notebook runner.
         
         Args:
             output_dir: Directory to store executed notebooks
             timeout_seconds: Maximum execution time in seconds (default: 5 minutes)
+            warm_kernels: Number of pre-started kernels to keep ready (0 disables the pool)
         """
         logger.info(f"Initializing NotebookRunner with output_dir={output_dir}, timeout={timeout_seconds}s")
         self.output_dir = output_dir
         self.timeout_seconds = timeout_seconds
         self._ensure_output_dir()
-        self.kernel_name = self._detect_kernel()
+        self.kernel_name = _detect_kernel()
+        self.kernel_pool = None
+        if warm_kernels > 0 and self.kernel_name is not None:
+            self.kernel_pool = get_kernel_pool(self.kernel_name, warm_kernels)
         logger.info(f"NotebookRunner initialized with kernel: {self.kernel_name}")
 
 
+    @classmethod
+    def invalidate_kernel_cache(cls):
+        """Forget the detected kernel so the next runner scans kernelspecs again."""
+        _detect_kernel.cache_clear()
+
+
     def _ensure_output_dir(self):
         """Ensure output directory exists."""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-            logger.info(f"Created output directory: {self.output_dir}")
-
-    def _detect_kernel(self) -> Optional[str]:
-        """Detect the best available Python kernel.
-        
-        Returns:
-            Name of the kernel to use, or None to use notebook's default
-        """
-        try:
-            ksm = KernelSpecManager()
-            available_kernels = ksm.get_all_specs()
-            logger.debug(f"Available kernels: {list(available_kernels.keys())}")
-            
-            # Preferred kernel names in order of preference
-            preferred_kernels = ['python3', 'python', 'python2', 'ir']
-            
-            for kernel in preferred_kernels:
-                if kernel in available_kernels:
-                    logger.info(f"Selected kernel: {kernel}")
-                    return kernel
-            
-            # If none of the preferred kernels found, use the first available
-            if available_kernels:
-                first_kernel = list(available_kernels.keys())[0]
-                logger.info(f"Using first available kernel: {first_kernel}")
-                return first_kernel
-            
-            # Return None to let papermill use the notebook's kernel metadata
-            logger.warning("No kernels found, will use notebook's default kernel")
-            return None
-            
-        except Exception as e:
-            logger.error(f"Could not detect kernel: {e}", exc_info=True)
-            return None
+        os.makedirs(self.output_dir, exist_ok=True)
 
 
     def execute_notebook(
@@ -94,17 +117,19 @@ class NotebookRunner:
         """
 
         # Generate output path
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         notebook_name = os.path.splitext(os.path.basename(notebook_path))[0]
 
         output_path = os.path.join(
             self.output_dir,
-            f"{notebook_name}_{timestamp}_executed.ipynb"
+            f"{notebook_name}_{timestamp}_{uuid.uuid4().hex[:8]}_executed.ipynb"
         )
         
         logger.info(f"Starting execution of notebook: {notebook_path}")
         logger.debug(f"Output will be saved to: {output_path}")
 
+        km = self.kernel_pool.acquire() if self.kernel_pool is not None else None
+
         try:
             # Prepare execution parameters
             exec_params = {
@@ -112,6 +137,9 @@ class NotebookRunner:
                 'output_path': output_path,
                 'parameters': parameters or {},
                 'progress_bar': False,
+                # Write the output notebook once at the end (or on error)
+                # instead of rewriting it before and after every cell
+                'request_save_on_cell_execute': False,
                 'execution_timeout': self.timeout_seconds,  # Timeout per cell
                 'timeout': self.timeout_seconds * 10  # Overall timeout
             }
@@ -119,6 +147,10 @@ class NotebookRunner:
             # Only set kernel_name if one was detected
             if self.kernel_name is not None:
                 exec_params['kernel_name'] = self.kernel_name
+
+            # Run on a pre-started kernel; papermill passes km through to nbclient
+            if km is not None:
+                exec_params['km'] = km
             
             logger.debug(f"Execution parameters: kernel={self.kernel_name}, timeout={self.timeout_seconds}s")
             
@@ -141,6 +173,11 @@ class NotebookRunner:
             logger.error(f"Fatal error executing {notebook_path}: {error_msg}", exc_info=True)
             return False, None, error_msg
 
+        finally:
+            # Pooled kernels are single-use so submissions never share state
+            if km is not None:
+                self.kernel_pool.release(km)
+
 
     def execute_notebook_safe(
         self,
@@ -163,7 +200,7 @@ class NotebookRunner:
             }
         """
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         logger.info(f"Safe execution started for: {notebook_path}")
 
         success, output_path, error_message = self.execute_notebook(
@@ -171,7 +208,7 @@ class NotebookRunner:
             parameters
         )
 
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         
         logger.info(f"Execution completed in {execution_time:.2f}s - Success: {success}")
         if not success:
@@ -185,6 +222,43 @@ class NotebookRunner:
         }
     
 
+    def execute_notebooks_batch(
+        self,
+        jobs: List[Tuple[str, Optional[Dict]]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, any]]:
+        """Execute several notebooks concurrently, one worker process each.
+
+        Processes rather than threads are used because papermill changes the
+        working directory while it runs a notebook, which is not thread-safe.
+        Notebooks share the working directory, so ones that write files there
+        (e.g. a submission's CSV) should not be batched together.
+
+        Args:
+            jobs: List of (notebook_path, parameters) pairs
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            List of execute_notebook_safe() result dictionaries, in the same
+            order as jobs
+        """
+
+        logger.info(f"Batch execution of {len(jobs)} notebook(s) started")
+
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            results = list(executor.map(
+                _execute_in_worker,
+                [self.output_dir] * len(jobs),
+                [self.timeout_seconds] * len(jobs),
+                [notebook_path for notebook_path, _ in jobs],
+                [parameters for _, parameters in jobs]
+            ))
+
+        succeeded = sum(result['success'] for result in results)
+        logger.info(f"Batch execution finished: {succeeded}/{len(jobs)} succeeded")
+        return results
+
+
     def get_notebook_outputs(self, executed_notebook_path: str) -> Optional[Dict]:
         """Extract outputs from an executed notebook.
         
@@ -197,14 +271,21 @@ class NotebookRunner:
 
         try:
             logger.debug(f"Extracting outputs from: {executed_notebook_path}")
-            with open(executed_notebook_path, 'r') as f:
-                nb = nbformat.read(f, as_version=4)
+            with open(executed_notebook_path, 'rb') as f:
+                raw = f.read()
+
+            # Executed notebooks carry large embedded outputs; parse the JSON
+            # directly and skip nbformat's schema validation. Only older
+            # formats need nbformat to upgrade them to v4.
+            nb = json.loads(raw)
+            if nb.get('nbformat', 0) < 4:
+                nb = nbformat.reads(raw.decode('utf-8'), as_version=4)
             
             outputs = {}
 
-            for i, cell in enumerate(nb.cells):
-                if cell.cell_type == 'code' and cell.outputs:
-                    outputs[f'cell_{i}'] = cell.outputs
+            for i, cell in enumerate(nb['cells']):
+                if cell.get('cell_type') == 'code' and cell.get('outputs'):
+                    outputs[f'cell_{i}'] = cell['outputs']
             
             logger.debug(f"Extracted {len(outputs)} cell outputs")
             return outputs
@@ -238,3 +319,24 @@ class NotebookRunner:
         except Exception as e:
             logger.error(f"Error extracting namespace from {executed_notebook_path}: {e}", exc_info=True)
             return None
+
+
+def _execute_in_worker(
+    output_dir: str,
+    timeout_seconds: int,
+    notebook_path: str,
+    parameters: Optional[Dict]
+) -> Dict[str, any]:
+    """Execute one notebook inside a batch worker process.
+
+    Args:
+        output_dir: Directory to store executed notebooks
+        timeout_seconds: Maximum execution time in seconds
+        notebook_path: Path to the notebook file
+        parameters: Optional parameters to inject into notebook
+
+    Returns:
+        execute_notebook_safe() result dictionary
+    """
+    runner = NotebookRunner(output_dir, timeout_seconds=timeout_seconds)
+    return runner.execute_notebook_safe(notebook_path, parameters)
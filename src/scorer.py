@@ -5,6 +5,7 @@ CSV files generated by executed notebooks. Modify this to match your
 specific assignment requirements.
 """
 
+import functools
 import os
 import pandas as pd
 from typing import Optional, Any
@@ -16,6 +17,40 @@ from .logger import get_logger
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _read_ground_truth(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Read a ground truth CSV, cached per process.
+
+    The modification time is part of the cache key, so an edited file is
+    read again. Callers must not modify the returned DataFrame.
+
+    Args:
+        path: Path to the ground truth CSV file
+        mtime_ns: Modification time of the file in nanoseconds
+
+    Returns:
+        Ground truth DataFrame
+    """
+    return pd.read_csv(path)
+
+
+def _find_first_csv(directory: str, exclude_files: list) -> Optional[str]:
+    """Find a CSV file in a directory, stopping at the first match.
+
+    Args:
+        directory: Directory to scan
+        exclude_files: File names to skip
+
+    Returns:
+        Path of the first matching CSV file, or None if there is none
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.csv') and entry.name not in exclude_files:
+                return entry.path
+    return None
+
+
 class Scorer:
     """Handles scoring of notebook outputs based on CSV files."""
 
@@ -28,6 +63,7 @@ class Scorer:
         logger.info(f"Initializing Scorer with ground_truth_path={ground_truth_path}")
         self.ground_truth_path = ground_truth_path
         self.ground_truth = None
+        self._original_r2 = None
 
         if ground_truth_path and os.path.exists(ground_truth_path):
             self._load_ground_truth()
@@ -35,7 +71,10 @@ class Scorer:
     def _load_ground_truth(self):
         """Load ground truth data from CSV file."""
         try:
-            self.ground_truth = pd.read_csv(self.ground_truth_path)
+            self.ground_truth = _read_ground_truth(
+                self.ground_truth_path,
+                os.stat(self.ground_truth_path).st_mtime_ns
+            )
             logger.info(f"Loaded ground truth: shape={self.ground_truth.shape}, columns={list(self.ground_truth.columns)}")
         except Exception as e:
             logger.error(f"Could not load ground truth from {self.ground_truth_path}: {e}", exc_info=True)
@@ -80,30 +119,21 @@ class Scorer:
             # Exclude ground truth and other system CSVs (only from root/data directories)
             exclude_files = ['california_housing.csv']
             
-            # Look for CSV file in multiple locations
-            csv_files = []
+            # Look for CSV file in multiple locations. Only the first match is
+            # used, so each directory scan stops as soon as one is found.
             
             # First, check the notebook's directory (outputs directory - accept all CSVs here)
-            if os.path.exists(notebook_dir):
-                csv_files = [
-                    os.path.join(notebook_dir, f) 
-                    for f in os.listdir(notebook_dir) 
-                    if f.endswith('.csv') and f not in exclude_files
-                ]
+            csv_path = _find_first_csv(notebook_dir, exclude_files)
             
             # If not found, check the current working directory
             # (here we exclude housing_df.csv to avoid picking up old test files)
-            if not csv_files and os.path.exists(cwd):
-                exclude_files_cwd = exclude_files + ['housing_df.csv']
-                csv_files = [
-                    os.path.join(cwd, f) 
-                    for f in os.listdir(cwd) 
-                    if f.endswith('.csv') and f not in exclude_files_cwd and 'data/' not in f
-                ]
-                if csv_files:
+            exclude_files_cwd = exclude_files + ['housing_df.csv']
+            if csv_path is None and os.path.exists(cwd):
+                csv_path = _find_first_csv(cwd, exclude_files_cwd)
+                if csv_path is not None:
                     logger.debug(f"Found CSV file(s) in working directory: {cwd}")
             
-            if not csv_files:
+            if csv_path is None:
                 error_msg = "No CSV output file found. Your notebook must save a CSV file with your engineered features."
                 logger.error(f"No CSV file found in notebook directory: {notebook_dir}")
                 logger.debug(f"Also checked working directory: {cwd}")
@@ -111,8 +141,6 @@ class Scorer:
                 logger.debug(f"CSV files in working dir (excluding system files): {[f for f in os.listdir(cwd) if f.endswith('.csv') and f not in exclude_files_cwd] if os.path.exists(cwd) else 'N/A'}")
                 return 0.0, error_msg
             
-            # Use the first CSV file found (or implement custom logic to find the right one)
-            csv_path = csv_files[0]
             logger.info(f"Found CSV file: {csv_path}")
             
             # Read the submission CSV
@@ -136,6 +164,26 @@ class Scorer:
             logger.error(f"Error in score_notebook for {executed_notebook_path}: {error_msg}", exc_info=True)
             return 0.0, error_msg
 
+    def _get_original_r2(self) -> float:
+        """Cross-validated R² of the baseline model on the ground truth.
+
+        The ground truth never changes, so the 10-fold cross-validation is
+        run once per Scorer instead of once per submission.
+
+        Returns:
+            Mean R² across folds
+        """
+        if self._original_r2 is None:
+            scores_original = cross_val_score(
+                LinearRegression(),
+                self.ground_truth.drop('MedHouseVal', axis=1),
+                self.ground_truth['MedHouseVal'],
+                cv=10,
+                scoring='r2'
+            )
+            self._original_r2 = scores_original.mean()
+        return self._original_r2
+
     def _score_against_ground_truth(self, submission_df: pd.DataFrame) -> float:
         """Score submission DataFrame against ground truth.
         
@@ -151,14 +199,8 @@ class Scorer:
             
             model = LinearRegression()
 
-            # Evaluate on original dataset
-            scores_original = cross_val_score(
-                model,
-                self.ground_truth.drop('MedHouseVal', axis=1),
-                self.ground_truth['MedHouseVal'],
-                cv=10,
-                scoring='r2'
-            )
+            # Evaluate on original dataset (computed once, then cached)
+            original_mean = self._get_original_r2()
 
             # Evaluate on engineered dataset
             scores_engineered = cross_val_score(
@@ -170,7 +212,6 @@ class Scorer:
             )
 
             engineered_mean = scores_engineered.mean()
-            original_mean = scores_original.mean()
             mean_improvement = ((engineered_mean - original_mean) / original_mean) * 100
 
             logger.info(f"Scoring results - Original R²: {original_mean:.4f}, Engineered R²: {engineered_mean:.4f}, Improvement: {mean_improvement:.2f}%")
@@ -4,6 +4,7 @@ import unittest
 import os
 import tempfile
 import shutil
+import sqlite3
 from datetime import datetime
 
 from src.database import Database
@@ -21,6 +22,7 @@ class TestDatabase(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test database after each test."""
+        self.db.close()
         # Remove temporary directory
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
@@ -29,6 +31,77 @@ class TestDatabase(unittest.TestCase):
         """Test database and tables are created."""
         self.assertTrue(os.path.exists(self.db_path))
     
+    def test_wal_mode_enabled(self):
+        """Test database is switched to write-ahead logging."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(mode, "wal")
+    
+    def test_leaderboard_query_uses_covering_index(self):
+        """Test the leaderboard listing is served from the covering index."""
+        with self.db._get_connection() as conn:
+            plan = conn.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT username, best_score, submission_count, last_updated
+                FROM leaderboard
+                ORDER BY best_score DESC, username
+            """).fetchall()
+        details = " ".join(row[3] for row in plan)
+        self.assertIn("COVERING INDEX idx_leaderboard_cover", details)
+        self.assertNotIn("TEMP B-TREE", details)
+    
+    def test_running_submissions_use_partial_index(self):
+        """Test stuck-submission cleanup searches the partial status index."""
+        with self.db._get_connection() as conn:
+            plan = conn.execute("""
+                EXPLAIN QUERY PLAN
+                UPDATE submissions SET status = 'failed' WHERE status = 'running'
+            """).fetchall()
+        details = " ".join(row[3] for row in plan)
+        self.assertIn("idx_submissions_running", details)
+    
+    def test_best_score_recalculation_uses_covering_index(self):
+        """Test a user's completed scores are read from the composite index."""
+        with self.db._get_connection() as conn:
+            plan = conn.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT id, score, ROW_NUMBER() OVER (ORDER BY score DESC, id)
+                FROM submissions
+                WHERE username = ? AND status = 'completed'
+            """, ("user1",)).fetchall()
+        details = " ".join(row[3] for row in plan)
+        self.assertIn("COVERING INDEX idx_submissions_user_status_score", details)
+        self.assertNotIn("TEMP B-TREE", details)
+    
+    def test_incremental_vacuum_enabled(self):
+        """Test database is created with incremental auto-vacuum."""
+        with self.db._get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+    
+    def test_maintenance_reclaims_free_pages(self):
+        """Test that maintenance releases pages freed by deletes."""
+        for i in range(200):
+            self.db.add_submission(f"user{i}", "x" * 2000, "failed", error_message="e" * 2000)
+        with self.db._get_connection() as conn:
+            conn.execute("DELETE FROM submissions")
+            self.assertGreater(conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+        
+        self.db.maintenance()
+        
+        with self.db._get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+    
+    def test_connections_are_reused(self):
+        """Test that sequential operations reuse a pooled connection."""
+        with self.db._get_connection() as conn1:
+            pass
+        with self.db._get_connection() as conn2:
+            pass
+        self.assertIs(conn1, conn2)
+    
     def test_add_submission(self):
         """Test adding a submission."""
         submission_id = self.db.add_submission(
@@ -74,7 +147,26 @@ class TestDatabase(unittest.TestCase):
         submission = self.db.get_submission(submission_id)
         self.assertEqual(submission['status'], "completed")
         self.assertEqual(submission['score'], 85.5)
-    
+
+    def test_fail_running_submissions(self):
+        """Test that only running submissions are marked failed, in one call."""
+        running_ids = [
+            self.db.add_submission(f"user{i}", f"/path/notebook{i}.ipynb", "running")
+            for i in range(3)
+        ]
+        done_id = self.db.add_submission("done", "/path/done.ipynb", "completed", score=50.0)
+
+        updated = self.db.fail_running_submissions("interrupted")
+
+        self.assertEqual([sub['id'] for sub in updated], running_ids)
+        self.assertEqual(updated[0]['username'], "user0")
+        for submission_id in running_ids:
+            submission = self.db.get_submission(submission_id)
+            self.assertEqual(submission['status'], "failed")
+            self.assertEqual(submission['error_message'], "interrupted")
+        self.assertEqual(self.db.get_submission(done_id)['status'], "completed")
+        self.assertEqual(self.db.fail_running_submissions("interrupted"), [])
+
     def test_get_user_submissions(self):
         """Test retrieving all submissions for a user."""
         # Add multiple submissions
@@ -144,14 +236,31 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(leaderboard[0]['best_score'], 90.0)
         self.assertEqual(leaderboard[0]['submission_count'], 2)
     
+    def test_update_leaderboard_tracks_best_submission_id(self):
+        """Test best_submission_id only moves when the score improves."""
+        id1 = self.db.add_submission("user1", "/path/nb1.ipynb", "completed", score=80.0)
+        self.db.update_leaderboard("user1", id1, 80.0)
+        id2 = self.db.add_submission("user1", "/path/nb2.ipynb", "completed", score=70.0)
+        self.db.update_leaderboard("user1", id2, 70.0)
+
+        with self.db._get_connection() as conn:
+            row = conn.execute("SELECT best_submission_id FROM leaderboard WHERE username = 'user1'").fetchone()
+        self.assertEqual(row['best_submission_id'], id1)
+
+        id3 = self.db.add_submission("user1", "/path/nb3.ipynb", "completed", score=95.0)
+        self.db.update_leaderboard("user1", id3, 95.0)
+
+        with self.db._get_connection() as conn:
+            row = conn.execute("SELECT best_submission_id FROM leaderboard WHERE username = 'user1'").fetchone()
+        self.assertEqual(row['best_submission_id'], id3)
+    
     def test_get_leaderboard_ordering(self):
         """Test leaderboard is ordered by score descending."""
         # Add submissions for multiple users
-        for i, score in enumerate([75.0, 90.0, 85.0]):
-            submission_id = self.db.add_submission(
-                f"user{i}", f"/path/notebook{i}.ipynb", "completed", score=score
-            )
-            self.db.update_leaderboard(f"user{i}", submission_id, score)
+        self.db.add_submissions_bulk([
+            {'username': f"user{i}", 'notebook_path': f"/path/notebook{i}.ipynb", 'score': score}
+            for i, score in enumerate([75.0, 90.0, 85.0])
+        ])
         
         # Get leaderboard
         leaderboard = self.db.get_leaderboard()
@@ -170,11 +279,10 @@ class TestDatabase(unittest.TestCase):
     def test_get_leaderboard_with_limit(self):
         """Test leaderboard limit parameter."""
         # Add multiple users
-        for i in range(10):
-            submission_id = self.db.add_submission(
-                f"user{i}", f"/path/notebook{i}.ipynb", "completed", score=float(i)
-            )
-            self.db.update_leaderboard(f"user{i}", submission_id, float(i))
+        self.db.add_submissions_bulk([
+            {'username': f"user{i}", 'notebook_path': f"/path/notebook{i}.ipynb", 'score': float(i)}
+            for i in range(10)
+        ])
         
         # Get top 5
         leaderboard = self.db.get_leaderboard(limit=5)
@@ -196,6 +304,88 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(rank, 1)
         self.assertEqual(user_data['best_score'], 90.0)
     
+    def test_add_submissions_bulk(self):
+        """Test bulk insert adds all rows and rebuilds the leaderboard."""
+        existing_id = self.db.add_submission("alice", "/a0.ipynb", "completed", score=70.0)
+        self.db.update_leaderboard("alice", existing_id, 70.0)
+        
+        inserted = self.db.add_submissions_bulk([
+            {'username': 'alice', 'notebook_path': '/a1.ipynb', 'score': 90.0},
+            {'username': 'alice', 'notebook_path': '/a2.ipynb', 'score': 80.0},
+            {'username': 'bob', 'notebook_path': '/b1.ipynb', 'status': 'failed',
+             'error_message': 'boom'},
+            {'username': 'carol', 'notebook_path': '/c1.ipynb', 'score': 50.0,
+             'timestamp': '2024-01-01 00:00:00'},
+        ])
+        
+        self.assertEqual(inserted, 4)
+        self.assertEqual(len(self.db.get_all_submissions()), 5)
+        
+        leaderboard = {entry['username']: entry for entry in self.db.get_leaderboard()}
+        self.assertEqual(set(leaderboard), {'alice', 'carol'})
+        self.assertEqual(leaderboard['alice']['best_score'], 90.0)
+        self.assertEqual(leaderboard['alice']['submission_count'], 3)
+        self.assertEqual(leaderboard['carol']['submission_count'], 1)
+    
+    def test_add_submissions_bulk_empty(self):
+        """Test bulk insert with no rows is a no-op."""
+        version = self.db.version
+        self.assertEqual(self.db.add_submissions_bulk([]), 0)
+        self.assertEqual(self.db.version, version)
+    
+    def test_finalize_submission(self):
+        """Test finalizing a submission updates both tables and returns the rank."""
+        id1 = self.db.add_submission("user1", "/path/nb1.ipynb", "running")
+        self.assertEqual(self.db.finalize_submission(id1, "user1", 80.0), 1)
+
+        id2 = self.db.add_submission("user2", "/path/nb2.ipynb", "running")
+        self.assertEqual(self.db.finalize_submission(id2, "user2", 70.0), 2)
+
+        submission = self.db.get_submission(id2)
+        self.assertEqual(submission['status'], "completed")
+        self.assertEqual(submission['score'], 70.0)
+
+        id3 = self.db.add_submission("user2", "/path/nb3.ipynb", "running")
+        self.assertEqual(self.db.finalize_submission(id3, "user2", 95.0), 1)
+
+        leaderboard = self.db.get_leaderboard()
+        self.assertEqual(leaderboard[0]['username'], "user2")
+        self.assertEqual(leaderboard[0]['submission_count'], 2)
+    
+    def test_get_leaderboard_columns(self):
+        """Test column-wise leaderboard matches the row-wise one."""
+        for username, score in [("user1", 70.0), ("user2", 90.0), ("user3", 80.0)]:
+            submission_id = self.db.add_submission(username, "/path/nb.ipynb", "completed", score=score)
+            self.db.update_leaderboard(username, submission_id, score)
+        
+        columns = self.db.get_leaderboard_columns()
+        rows = self.db.get_leaderboard()
+        
+        self.assertEqual(columns['rank'], [1, 2, 3])
+        self.assertEqual(columns['username'], ["user2", "user3", "user1"])
+        for name, values in columns.items():
+            self.assertEqual(values, [row[name] for row in rows])
+        
+        empty = Database(os.path.join(self.test_dir, "empty.db"))
+        self.assertEqual(empty.get_leaderboard_columns(), {
+            'rank': [], 'username': [], 'best_score': [],
+            'submission_count': [], 'last_updated': []
+        })
+        empty.close()
+    
+    def test_get_user_rank_matches_leaderboard_with_ties(self):
+        """Test rank lookups agree with get_leaderboard when scores tie."""
+        for username, score in [("carol", 80.0), ("alice", 80.0), ("bob", 90.0), ("dave", 70.0)]:
+            submission_id = self.db.add_submission(
+                username, f"/path/{username}.ipynb", "completed", score=score
+            )
+            self.db.update_leaderboard(username, submission_id, score)
+
+        for entry in self.db.get_leaderboard():
+            rank, user_data = self.db.get_user_rank(entry['username'])
+            self.assertEqual(rank, entry['rank'])
+            self.assertEqual(user_data['best_score'], entry['best_score'])
+    
     def test_get_user_rank_nonexistent(self):
         """Test getting rank for non-existent user."""
         result = self.db.get_user_rank("nonexistent")
@@ -215,13 +405,48 @@ class TestDatabase(unittest.TestCase):
     def test_get_all_submissions_with_limit(self):
         """Test getting all submissions with limit."""
         # Add multiple submissions
-        for i in range(10):
-            self.db.add_submission(f"user{i}", f"/path/notebook{i}.ipynb", "completed")
+        self.db.add_submissions_bulk([
+            {'username': f"user{i}", 'notebook_path': f"/path/notebook{i}.ipynb"}
+            for i in range(10)
+        ])
         
         # Get limited
         submissions = self.db.get_all_submissions(limit=5)
         self.assertEqual(len(submissions), 5)
     
+    def test_get_recent_submissions(self):
+        """Test recent submissions are newest first, limited, and slimmed down."""
+        for i in range(5):
+            self.db.add_submission(f"user{i}", f"/path/notebook{i}.ipynb", "completed", score=float(i))
+
+        recent = self.db.get_recent_submissions(limit=3)
+        self.assertEqual(len(recent), 3)
+        self.assertEqual([r['username'] for r in recent], ["user4", "user3", "user2"])
+        self.assertEqual(set(recent[0].keys()), {'username', 'timestamp', 'score', 'status'})
+    
+    def test_get_submission_summaries(self):
+        """Test admin summaries omit the long text columns."""
+        self.db.add_submission("user1", "/path/notebook1.ipynb", "failed", error_message="Boom")
+        self.db.add_submission("user2", "/path/notebook2.ipynb", "completed", score=90.0)
+
+        summaries = self.db.get_submission_summaries()
+        self.assertEqual(len(summaries), 2)
+        self.assertEqual(summaries[0]['username'], "user2")
+        self.assertEqual(set(summaries[0].keys()), {'id', 'username', 'score', 'status', 'timestamp'})
+    
+    def test_get_notebook_paths(self):
+        """Test every stored notebook path is returned once."""
+        self.assertEqual(self.db.get_notebook_paths(), set())
+        
+        self.db.add_submission("user1", "/path/notebook1.ipynb", "failed")
+        self.db.add_submission("user2", "/path/notebook2.ipynb", "completed", score=90.0)
+        self.db.add_submission("user1", "/path/notebook1.ipynb", "completed", score=80.0)
+        
+        self.assertEqual(
+            self.db.get_notebook_paths(),
+            {"/path/notebook1.ipynb", "/path/notebook2.ipynb"}
+        )
+    
     def test_clear_leaderboard(self):
         """Test clearing all data."""
         # Add some data
@@ -238,6 +463,31 @@ class TestDatabase(unittest.TestCase):
         submissions = self.db.get_all_submissions()
         self.assertEqual(len(leaderboard), 0)
         self.assertEqual(len(submissions), 0)
+        
+        # IDs start over and foreign keys are enforced again
+        self.assertEqual(self.db.add_submission("user2", "/path/notebook.ipynb"), 1)
+        with self.db._get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+    
+    def test_clear_leaderboard_failure_restores_foreign_keys(self):
+        """Test a failed clear rolls back and leaves foreign keys enforced."""
+        submission_id = self.db.add_submission(
+            "user1", "/path/notebook.ipynb", "completed", score=80.0
+        )
+        self.db.update_leaderboard("user1", submission_id, 80.0)
+        with self.db._get_connection() as conn:
+            conn.execute("""
+                CREATE TRIGGER block_delete BEFORE DELETE ON submissions
+                BEGIN SELECT RAISE(ABORT, 'blocked'); END
+            """)
+        
+        with self.assertRaises(sqlite3.DatabaseError):
+            self.db.clear_leaderboard()
+        
+        # Nothing was deleted and the pooled connection enforces foreign keys
+        self.assertEqual(len(self.db.get_leaderboard()), 1)
+        with self.db._get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
     
     def test_submission_with_error_message(self):
         """Test adding submission with error message."""
@@ -290,6 +540,109 @@ class TestDatabase(unittest.TestCase):
         result = self.db.remove_submission(99999)
         self.assertFalse(result)
 
+    def test_find_submission_by_hash(self):
+        """Test looking up a completed submission by notebook hash."""
+        self.db.add_submission("user1", "/path/nb1.ipynb", "failed", notebook_hash="abc")
+        self.assertIsNone(self.db.find_submission_by_hash("user1", "abc"))
+
+        submission_id = self.db.add_submission(
+            "user1", "/path/nb2.ipynb", "completed", score=80.0, notebook_hash="abc"
+        )
+        found = self.db.find_submission_by_hash("user1", "abc")
+        self.assertEqual(found['id'], submission_id)
+        self.assertEqual(found['score'], 80.0)
+
+        # Hashes are scoped per user
+        self.assertIsNone(self.db.find_submission_by_hash("user2", "abc"))
+
+    def test_notebook_hash_column_added_to_existing_db(self):
+        """Test that an older database without notebook_hash is migrated."""
+        old_path = os.path.join(self.test_dir, "old.db")
+        conn = sqlite3.connect(old_path)
+        conn.execute("""
+            CREATE TABLE submissions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT NOT NULL,
+                timestamp DATETIME NOT NULL,
+                notebook_path TEXT NOT NULL,
+                score REAL,
+                status TEXT NOT NULL,
+                error_message TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+        db2 = Database(old_path)
+        submission_id = db2.add_submission("user", "/path/nb.ipynb", "completed", notebook_hash="abc")
+        self.assertEqual(db2.get_submission(submission_id)['notebook_hash'], "abc")
+        db2.close()
+
+    def test_get_statistics(self):
+        """Test aggregate statistics come back from a single query."""
+        stats = self.db.get_statistics()
+        self.assertEqual(stats['total_submissions'], 0)
+        self.assertIsNone(stats['highest_score'])
+
+        id1 = self.db.add_submission("user1", "/path/nb1.ipynb", "completed", score=80.0)
+        self.db.update_leaderboard("user1", id1, 80.0)
+        id2 = self.db.add_submission("user2", "/path/nb2.ipynb", "completed", score=90.0)
+        self.db.update_leaderboard("user2", id2, 90.0)
+        self.db.add_submission("user2", "/path/nb3.ipynb", "failed")
+
+        stats = self.db.get_statistics()
+        self.assertEqual(stats['total_submissions'], 3)
+        self.assertEqual(stats['total_users'], 2)
+        self.assertEqual(stats['successful_submissions'], 2)
+        self.assertEqual(stats['failed_submissions'], 1)
+        self.assertEqual(stats['average_score'], 85.0)
+        self.assertEqual(stats['highest_score'], 90.0)
+        self.assertEqual(stats['lowest_score'], 80.0)
+
+    def test_get_user_submission_aggregates(self):
+        """Test per-user aggregates are computed for that user only."""
+        self.db.add_submission("user1", "/a.ipynb", "completed", score=80.0)
+        self.db.add_submission("user1", "/b.ipynb", "completed", score=90.0)
+        self.db.add_submission("user1", "/c.ipynb", "failed", error_message="boom")
+        self.db.add_submission("user2", "/d.ipynb", "completed", score=10.0)
+        
+        aggregates = self.db.get_user_submission_aggregates("user1")
+        
+        self.assertEqual(aggregates['total_submissions'], 3)
+        self.assertEqual(aggregates['successful_submissions'], 2)
+        self.assertEqual(aggregates['failed_submissions'], 1)
+        self.assertEqual(aggregates['average_score'], 85.0)
+        
+        empty = self.db.get_user_submission_aggregates("nobody")
+        self.assertEqual(empty['total_submissions'], 0)
+        self.assertIsNone(empty['average_score'])
+    
+    def test_read_connections_are_query_only(self):
+        """Test that read accessors use connections that refuse writes."""
+        with self.db._get_read_connection() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM submissions")
+        with self.db._get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA query_only").fetchone()[0], 0)
+    
+    def test_version_increments_on_write(self):
+        """Test that the write counter changes after writes but not reads."""
+        start = self.db.version
+
+        submission_id = self.db.add_submission("user1", "/path/nb.ipynb", "completed", score=80.0)
+        self.assertGreater(self.db.version, start)
+
+        after_add = self.db.version
+        self.db.get_leaderboard()
+        self.db.get_all_submissions()
+        self.assertEqual(self.db.version, after_add)
+
+        self.db.update_leaderboard("user1", submission_id, 80.0)
+        self.assertGreater(self.db.version, after_add)
+
+        # A second instance on the same path sees the same counter
+        self.assertEqual(Database(self.db_path).version, self.db.version)
+
     def test_invalid_db_file_is_replaced(self):
         """Test that a corrupt/LFS-pointer file at the DB path is silently replaced."""
         corrupt_path = os.path.join(self.test_dir, "corrupt.db")
@@ -0,0 +1,62 @@
+"""Unit tests for hub_sync module."""
+
+import unittest
+import threading
+import time
+
+from src.hub_sync import HubSyncWorker
+
+
+class TestHubSyncWorker(unittest.TestCase):
+    """Test cases for the background Hub uploader."""
+
+    def test_burst_of_requests_is_coalesced(self):
+        """Test that several quick requests result in a single upload."""
+        uploads = []
+        done = threading.Event()
+
+        def upload():
+            uploads.append(time.monotonic())
+            done.set()
+
+        worker = HubSyncWorker(upload, delay_seconds=0.2)
+        for _ in range(5):
+            worker.request_upload()
+
+        self.assertTrue(done.wait(timeout=5))
+        time.sleep(0.3)
+        self.assertEqual(len(uploads), 1)
+
+    def test_flush_uploads_pending_request(self):
+        """Test that flush uploads immediately and clears the pending request."""
+        uploads = []
+        worker = HubSyncWorker(lambda: uploads.append(1), delay_seconds=60)
+
+        worker.flush()
+        self.assertEqual(uploads, [])
+
+        worker.request_upload()
+        worker.flush()
+        self.assertEqual(uploads, [1])
+
+        worker.flush()
+        self.assertEqual(uploads, [1])
+
+    def test_upload_errors_are_swallowed(self):
+        """Test that a failing upload does not stop later uploads."""
+        calls = []
+
+        def upload():
+            calls.append(1)
+            raise RuntimeError("network down")
+
+        worker = HubSyncWorker(upload, delay_seconds=60)
+        worker.request_upload()
+        worker.flush()
+        worker.request_upload()
+        worker.flush()
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""Unit tests for kernel_pool module."""
+
+import unittest
+import asyncio
+import time
+from unittest.mock import patch, AsyncMock
+
+from jupyter_client.manager import AsyncKernelManager
+
+from src import kernel_pool
+from src.kernel_pool import KernelPool, PooledKernelManager, get_kernel_pool, shutdown_all
+
+
+class FakeKernelManager:
+    """Stands in for PooledKernelManager so no real kernel is started."""
+
+    def __init__(self, alive=True, dispose_error=None):
+        self.alive = alive
+        self.dispose_error = dispose_error
+        self.disposed = False
+
+    async def is_alive(self):
+        return self.alive
+
+    async def dispose(self):
+        self.disposed = True
+        if self.dispose_error:
+            raise self.dispose_error
+
+
+class FailingKernelClient:
+    """Kernel client whose kernel never becomes ready."""
+
+    def __init__(self):
+        self.channels_stopped = False
+
+    def start_channels(self):
+        pass
+
+    def stop_channels(self):
+        self.channels_stopped = True
+
+    async def wait_for_ready(self, timeout=None):
+        raise RuntimeError("Kernel didn't respond")
+
+
+async def start_fake_kernel(pool):
+    """Replacement for KernelPool._start_warm_kernel."""
+    return FakeKernelManager()
+
+
+class TestKernelPool(unittest.TestCase):
+    """Test cases for KernelPool with faked kernels."""
+
+    def setUp(self):
+        """Replace kernel startup with a fake for every test."""
+        patcher = patch.object(KernelPool, '_start_warm_kernel', start_fake_kernel)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutdown_all)
+
+    def wait_for_idle(self, pool, count, timeout=5.0):
+        """Wait until the background refill threads have queued `count` kernels."""
+        deadline = time.monotonic() + timeout
+        while pool._idle.qsize() < count:
+            if time.monotonic() > deadline:
+                self.fail(f"Pool did not reach {count} idle kernel(s)")
+            time.sleep(0.01)
+
+    def test_acquire_returns_none_when_empty(self):
+        """Test acquire falls back to None when no kernel is idle."""
+        pool = KernelPool("python3", size=0)
+        self.assertIsNone(pool.acquire())
+
+    def test_acquire_returns_warm_kernel_and_refills(self):
+        """Test a warm kernel is handed out and replaced."""
+        pool = KernelPool("python3", size=1)
+        self.wait_for_idle(pool, 1)
+
+        km = pool.acquire()
+
+        self.assertIsInstance(km, FakeKernelManager)
+        self.wait_for_idle(pool, 1)
+
+    def test_acquire_discards_dead_kernel(self):
+        """Test dead kernels are disposed of, skipped and replaced."""
+        pool = KernelPool("python3", size=0)
+        dead = FakeKernelManager(alive=False)
+        alive = FakeKernelManager()
+        pool._idle.put(dead)
+        pool._idle.put(alive)
+
+        km = pool.acquire()
+
+        self.assertIs(km, alive)
+        self.assertTrue(dead.disposed)
+        # One replacement was started for each kernel taken off the queue
+        self.wait_for_idle(pool, 2)
+
+    def test_failed_start_leaves_pool_empty(self):
+        """Test a kernel that fails to start is logged, not queued."""
+        async def fail(pool):
+            raise RuntimeError("no kernel")
+
+        with patch.object(KernelPool, '_start_warm_kernel', fail):
+            pool = KernelPool("python3", size=0)
+            pool._start_kernel()
+
+        self.assertIsNone(pool.acquire())
+
+    def test_release_swallows_dispose_errors(self):
+        """Test release logs shutdown errors instead of raising them."""
+        pool = KernelPool("python3", size=0)
+        km = FakeKernelManager(dispose_error=RuntimeError("already gone"))
+
+        pool.release(km)
+
+        self.assertTrue(km.disposed)
+
+    def test_shutdown_empties_idle_queue(self):
+        """Test shutdown disposes of every idle kernel."""
+        pool = KernelPool("python3", size=0)
+        kernels = [FakeKernelManager() for _ in range(3)]
+        for km in kernels:
+            pool._idle.put(km)
+
+        pool.shutdown()
+
+        self.assertTrue(pool._idle.empty())
+        self.assertTrue(all(km.disposed for km in kernels))
+
+    def test_get_kernel_pool_is_shared(self):
+        """Test pools are shared per (kernel name, size)."""
+        pool = get_kernel_pool("python3", 1)
+
+        self.assertIs(get_kernel_pool("python3", 1), pool)
+        self.assertIsNot(get_kernel_pool("python3", 2), pool)
+        self.assertIsNot(get_kernel_pool("other", 1), pool)
+
+    def test_shutdown_all_clears_pools(self):
+        """Test shutdown_all shuts down and forgets every shared pool."""
+        pool = get_kernel_pool("python3", 1)
+        self.wait_for_idle(pool, 1)
+
+        shutdown_all()
+
+        self.assertEqual(kernel_pool._pools, {})
+        self.assertTrue(pool._idle.empty())
+
+
+class TestStartWarmKernel(unittest.TestCase):
+    """Test cases for the real _start_warm_kernel with a faked kernel."""
+
+    def test_startup_failure_raises_original_error(self):
+        """Test a kernel that never becomes ready is disposed and its error kept."""
+        client = FailingKernelClient()
+        managers = []
+
+        def track_client(km, **kwargs):
+            managers.append(km)
+            return client
+
+        with patch.object(PooledKernelManager, 'start_kernel', AsyncMock()), \
+                patch.object(PooledKernelManager, 'is_alive', AsyncMock(return_value=True)), \
+                patch.object(PooledKernelManager, 'shutdown_kernel', AsyncMock()) as shutdown, \
+                patch.object(AsyncKernelManager, 'client', track_client):
+            pool = KernelPool("python3", size=0)
+            with self.assertRaisesRegex(RuntimeError, "didn't respond"):
+                asyncio.run(pool._start_warm_kernel())
+
+        self.assertTrue(client.channels_stopped)
+        self.assertEqual(managers[0]._clients, [])
+        shutdown.assert_awaited_once_with(now=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
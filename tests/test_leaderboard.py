@@ -7,7 +7,7 @@ import shutil
 import pandas as pd
 
 from src.database import Database
-from src.leaderboard import LeaderboardManager
+from src.leaderboard import LeaderboardManager, format_timestamps
 
 
 class TestLeaderboardManager(unittest.TestCase):
@@ -22,6 +22,7 @@ class TestLeaderboardManager(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test database after each test."""
+        self.db.close()
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
     
@@ -33,14 +34,10 @@ class TestLeaderboardManager(unittest.TestCase):
             ("charlie", 90.0)
         ]
         
-        for username, score in users:
-            submission_id = self.db.add_submission(
-                username=username,
-                notebook_path=f"/path/{username}.ipynb",
-                status="completed",
-                score=score
-            )
-            self.db.update_leaderboard(username, submission_id, score)
+        self.db.add_submissions_bulk([
+            {'username': username, 'notebook_path': f"/path/{username}.ipynb", 'score': score}
+            for username, score in users
+        ])
     
     def test_get_leaderboard_df_empty(self):
         """Test getting empty leaderboard as DataFrame."""
@@ -70,22 +67,24 @@ class TestLeaderboardManager(unittest.TestCase):
         self.add_test_submissions()
         df = self.lm.get_leaderboard_df()
         
-        # Should be ordered by score descending
-        self.assertEqual(df.iloc[0]['Username'], 'alice')  # 95.0
-        self.assertEqual(df.iloc[1]['Username'], 'charlie')  # 90.0
-        self.assertEqual(df.iloc[2]['Username'], 'bob')  # 85.0
-        
-        # Check ranks
-        self.assertEqual(df.iloc[0]['Rank'], 1)
-        self.assertEqual(df.iloc[1]['Rank'], 2)
-        self.assertEqual(df.iloc[2]['Rank'], 3)
+        # Should be ordered by score descending, ranked from 1
+        expected = pd.DataFrame({
+            'Rank': [1, 2, 3],
+            'Username': ['alice', 'charlie', 'bob'],
+            'Best Score': [95.0, 90.0, 85.0]
+        })
+        pd.testing.assert_frame_equal(
+            df[expected.columns].reset_index(drop=True), expected, check_dtype=False
+        )
     
     def test_get_leaderboard_df_with_limit(self):
         """Test leaderboard DataFrame with limit."""
         self.add_test_submissions()
-        df = self.lm.get_leaderboard_df(limit=2)
         
-        self.assertEqual(len(df), 2)
+        # Limits below, at and above the number of users, on one seeded database
+        for limit, expected in [(1, 1), (2, 2), (3, 3), (10, 3)]:
+            with self.subTest(limit=limit):
+                self.assertEqual(len(self.lm.get_leaderboard_df(limit=limit)), expected)
     
     def test_get_user_stats_existing_user(self):
         """Test getting statistics for existing user."""
@@ -154,6 +153,27 @@ class TestLeaderboardManager(unittest.TestCase):
         self.assertIn('Status', df.columns)
         self.assertIn('Error', df.columns)
     
+    def test_get_submission_history_df_truncates_errors(self):
+        """Test long error messages are truncated and missing ones kept."""
+        self.db.add_submission("testuser", "/path/test1.ipynb", "completed", score=80.0)
+        self.db.add_submission("testuser", "/path/test2.ipynb", "failed", error_message="x" * 150)
+        self.db.add_submission("testuser", "/path/test3.ipynb", "failed", error_message="short")
+        
+        errors = self.lm.get_submission_history_df("testuser")['Error'].tolist()
+        
+        self.assertEqual(errors[0], "short")
+        self.assertEqual(errors[1], "x" * 100 + "...")
+        self.assertIsNone(errors[2])
+    
+    def test_get_recent_submissions_df_only_failed(self):
+        """Test recent submissions with no scores at all still build a frame."""
+        self.db.add_submission("testuser", "/path/test1.ipynb", "failed", error_message="Error")
+        
+        df = self.lm.get_recent_submissions_df()
+        
+        self.assertEqual(list(df.columns), ['Username', 'Timestamp', 'Score', 'Status'])
+        self.assertTrue(df['Score'].isna().all())
+    
     def test_get_recent_submissions_df_empty(self):
         """Test getting empty recent submissions."""
         df = self.lm.get_recent_submissions_df()
@@ -175,11 +195,14 @@ class TestLeaderboardManager(unittest.TestCase):
     def test_get_recent_submissions_df_with_limit(self):
         """Test recent submissions with limit."""
         # Add many submissions
-        for i in range(15):
-            self.db.add_submission(f"user{i}", f"/path/test{i}.ipynb", "completed", score=float(i))
-        
-        df = self.lm.get_recent_submissions_df(limit=5)
-        self.assertEqual(len(df), 5)
+        self.db.add_submissions_bulk([
+            {'username': f"user{i}", 'notebook_path': f"/path/test{i}.ipynb", 'score': float(i)}
+            for i in range(15)
+        ])
+        
+        for limit, expected in [(5, 5), (15, 15), (20, 15)]:
+            with self.subTest(limit=limit):
+                self.assertEqual(len(self.lm.get_recent_submissions_df(limit=limit)), expected)
     
     def test_get_statistics_empty(self):
         """Test getting statistics with no data."""
@@ -224,9 +247,9 @@ class TestLeaderboardManager(unittest.TestCase):
         formatted_df = self.lm.format_leaderboard_for_display(df)
         
         # Check for medal emojis
-        self.assertIn('🥇', formatted_df.iloc[0]['Username'])  # Rank 1
-        self.assertIn('🥈', formatted_df.iloc[1]['Username'])  # Rank 2
-        self.assertIn('🥉', formatted_df.iloc[2]['Username'])  # Rank 3
+        self.assertEqual(
+            formatted_df['Username'].tolist(), ['🥇 alice', '🥈 charlie', '🥉 bob']
+        )
     
     def test_format_leaderboard_for_display_no_medal_for_rank_4(self):
         """Test that rank 4 and beyond don't get medals."""
@@ -280,5 +303,19 @@ class TestLeaderboardManager(unittest.TestCase):
         self.assertEqual(stats['average_score'], 80.0)
 
 
+class TestFormatTimestamps(unittest.TestCase):
+    """Test cases for the timestamp display helper."""
+    
+    def test_formats_mixed_iso_timestamps(self):
+        """Test stored timestamps with and without microseconds format the same."""
+        values = pd.Series(['2024-01-01 10:00:00.123456', '2024-01-01 10:00:00', '2024-01-01T10:00:00'])
+        self.assertEqual(format_timestamps(values).tolist(), ['2024-01-01 10:00:00'] * 3)
+    
+    def test_unparseable_values_become_na(self):
+        """Test missing or invalid timestamps are shown as N/A."""
+        values = pd.Series([None, 'not a date'])
+        self.assertEqual(format_timestamps(values).tolist(), ['N/A', 'N/A'])
+
+
 if __name__ == '__main__':
     unittest.main()
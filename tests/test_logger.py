@@ -6,9 +6,10 @@ import tempfile
 import shutil
 import warnings
 import logging
+from logging.handlers import QueueHandler
 from pathlib import Path
 
-from src.logger import get_logger, configure_warnings_logging
+from src.logger import get_logger, configure_warnings_logging, flush_logs
 
 
 class TestLogger(unittest.TestCase):
@@ -18,8 +19,7 @@ class TestLogger(unittest.TestCase):
         """Set up test environment before each test."""
         # Create temporary directory for test logs
         self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
+        self.log_dir = os.path.join(self.test_dir, "logs")
         
         # Clear any existing handlers from the warnings logger
         warnings_logger = logging.getLogger('py.warnings')
@@ -27,28 +27,26 @@ class TestLogger(unittest.TestCase):
         
     def tearDown(self):
         """Clean up test environment after each test."""
-        # Return to original directory
-        os.chdir(self.original_cwd)
-        
         # Remove temporary directory
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
     
     def test_logger_creation(self):
         """Test logger is created with correct handlers."""
-        logger = get_logger("test_module")
+        logger = get_logger("test_module", log_dir=self.log_dir)
         
-        # Check logger has correct handlers
-        self.assertEqual(len(logger.handlers), 3)  # file, error, console
+        # File, error and console handlers sit behind a single queue handler
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], QueueHandler)
         
         # Check log files are created
-        self.assertTrue(os.path.exists("logs/leaderboard.log"))
-        self.assertTrue(os.path.exists("logs/errors.log"))
+        self.assertTrue(os.path.exists(os.path.join(self.log_dir, "leaderboard.log")))
+        self.assertTrue(os.path.exists(os.path.join(self.log_dir, "errors.log")))
     
     def test_warnings_capture(self):
         """Test that warnings are captured in log files."""
         # Configure warnings logging
-        configure_warnings_logging()
+        configure_warnings_logging(log_dir=self.log_dir)
         
         # Trigger a warning
         with warnings.catch_warnings():
@@ -56,7 +54,7 @@ class TestLogger(unittest.TestCase):
             warnings.warn("Test warning", DeprecationWarning)
         
         # Check that log file exists and contains the warning
-        log_path = Path("logs/leaderboard.log")
+        log_path = Path(self.log_dir) / "leaderboard.log"
         self.assertTrue(log_path.exists())
         
         # Read log file
@@ -69,7 +67,7 @@ class TestLogger(unittest.TestCase):
     
     def test_logger_levels(self):
         """Test that different log levels are handled correctly."""
-        logger = get_logger("test_levels")
+        logger = get_logger("test_levels", log_dir=self.log_dir)
         
         # Log at different levels
         logger.debug("Debug message")
@@ -77,8 +75,11 @@ class TestLogger(unittest.TestCase):
         logger.warning("Warning message")
         logger.error("Error message")
         
+        # Records are written by a background thread
+        flush_logs()
+        
         # Check that all messages are in the main log
-        with open("logs/leaderboard.log", 'r') as f:
+        with open(os.path.join(self.log_dir, "leaderboard.log"), 'r') as f:
             log_contents = f.read()
         
         self.assertIn("Debug message", log_contents)
@@ -87,7 +88,7 @@ class TestLogger(unittest.TestCase):
         self.assertIn("Error message", log_contents)
         
         # Check that only error is in error log
-        with open("logs/errors.log", 'r') as f:
+        with open(os.path.join(self.log_dir, "errors.log"), 'r') as f:
             error_log = f.read()
         
         self.assertNotIn("Debug message", error_log)
@@ -5,11 +5,45 @@ import os
 import tempfile
 import json
 import shutil
-from unittest.mock import patch #, MagicMock
+from unittest.mock import patch, MagicMock
 
 from src.notebook_runner import NotebookRunner, TimeoutException
 
 
+# Serialized once; create_simple_notebook just writes this string
+SIMPLE_NOTEBOOK_JSON = json.dumps({
+    "cells": [
+        {
+            "cell_type": "code",
+            "execution_count": None,
+            "metadata": {},
+            "outputs": [],
+            "source": ["print('Hello World')"]
+        },
+        {
+            "cell_type": "code",
+            "execution_count": None,
+            "metadata": {},
+            "outputs": [],
+            "source": ["x = 42\n", "print(x)"]
+        }
+    ],
+    "metadata": {
+        "kernelspec": {
+            "display_name": "Python 3",
+            "language": "python",
+            "name": "python3"
+        },
+        "language_info": {
+            "name": "python",
+            "version": "3.8.0"
+        }
+    },
+    "nbformat": 4,
+    "nbformat_minor": 4
+})
+
+
 class TestNotebookRunner(unittest.TestCase):
     """Test cases for NotebookRunner class."""
     
@@ -26,41 +60,9 @@ class TestNotebookRunner(unittest.TestCase):
     
     def create_simple_notebook(self, filename="test.ipynb"):
         """Helper to create a simple valid notebook."""
-        notebook_content = {
-            "cells": [
-                {
-                    "cell_type": "code",
-                    "execution_count": None,
-                    "metadata": {},
-                    "outputs": [],
-                    "source": ["print('Hello World')"]
-                },
-                {
-                    "cell_type": "code",
-                    "execution_count": None,
-                    "metadata": {},
-                    "outputs": [],
-                    "source": ["x = 42\n", "print(x)"]
-                }
-            ],
-            "metadata": {
-                "kernelspec": {
-                    "display_name": "Python 3",
-                    "language": "python",
-                    "name": "python3"
-                },
-                "language_info": {
-                    "name": "python",
-                    "version": "3.8.0"
-                }
-            },
-            "nbformat": 4,
-            "nbformat_minor": 4
-        }
-        
         filepath = os.path.join(self.test_dir, filename)
         with open(filepath, 'w') as f:
-            json.dump(notebook_content, f)
+            f.write(SIMPLE_NOTEBOOK_JSON)
         
         return filepath
     
@@ -76,6 +78,33 @@ class TestNotebookRunner(unittest.TestCase):
         runner = NotebookRunner(output_dir=new_output_dir)
         self.assertTrue(os.path.exists(new_output_dir))
     
+    def test_kernel_detection_is_cached(self):
+        """Test the kernelspec directory is only scanned once per process."""
+        NotebookRunner.invalidate_kernel_cache()
+        with patch('src.notebook_runner.KernelSpecManager') as mock_ksm:
+            mock_ksm.return_value.get_all_specs.return_value = {'python3': {}}
+            first = NotebookRunner(output_dir=self.output_dir)
+            second = NotebookRunner(output_dir=self.output_dir)
+        NotebookRunner.invalidate_kernel_cache()
+        
+        self.assertEqual(first.kernel_name, 'python3')
+        self.assertEqual(second.kernel_name, 'python3')
+        mock_ksm.return_value.get_all_specs.assert_called_once()
+
+    @patch('src.notebook_runner.pm.execute_notebook')
+    def test_pooled_kernel_used_and_released(self, mock_execute):
+        """Test that a warm kernel is passed to papermill and released even on failure."""
+        mock_execute.side_effect = Exception("boom")
+        self.runner.kernel_pool = MagicMock()
+        km = self.runner.kernel_pool.acquire.return_value
+
+        notebook_path = self.create_simple_notebook()
+        success, _, _ = self.runner.execute_notebook(notebook_path)
+
+        self.assertFalse(success)
+        self.assertIs(mock_execute.call_args.kwargs['km'], km)
+        self.runner.kernel_pool.release.assert_called_once_with(km)
+
     @patch('src.notebook_runner.pm.execute_notebook')
     def test_execute_notebook_success(self, mock_execute):
         """Test successful notebook execution."""
@@ -246,6 +275,28 @@ class TestNotebookRunner(unittest.TestCase):
             self.assertIn("_executed.ipynb", output_path)
             self.assertTrue(output_path.startswith(self.output_dir))
 
+    def test_output_paths_are_unique(self):
+        """Test that back-to-back runs of one notebook don't overwrite each other."""
+        notebook_path = self.create_simple_notebook()
+
+        with patch('src.notebook_runner.pm.execute_notebook'):
+            _, first, _ = self.runner.execute_notebook(notebook_path)
+            _, second, _ = self.runner.execute_notebook(notebook_path)
+
+        self.assertNotEqual(first, second)
+
+    def test_execute_notebooks_batch_keeps_order(self):
+        """Test that batch results come back in job order."""
+        notebook_path = self.create_simple_notebook()
+        jobs = [(notebook_path, None), ("/nonexistent/notebook.ipynb", None)]
+
+        results = self.runner.execute_notebooks_batch(jobs, max_workers=2)
+
+        self.assertEqual(len(results), 2)
+        self.assertTrue(results[0]['success'])
+        self.assertTrue(os.path.exists(results[0]['output_path']))
+        self.assertFalse(results[1]['success'])
+
 
 class TestTimeoutException(unittest.TestCase):
     """Test cases for TimeoutException."""
@@ -0,0 +1,157 @@
+"""Unit tests for the reprocess_submissions utility."""
+
+import unittest
+import io
+import os
+import tempfile
+import shutil
+from contextlib import redirect_stdout
+from decimal import Decimal
+from unittest.mock import patch
+
+from src.database import Database
+from utils import reprocess_submissions
+from utils.reprocess_submissions import flush_results, reprocess_all_submissions
+
+
+class FakeRunner:
+    """Stands in for NotebookRunner: every notebook 'executes' in place."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def execute_notebook(self, notebook_path):
+        return True, notebook_path, None
+
+
+class FakeScorer:
+    """Stands in for Scorer, returning a fixed score per user."""
+
+    scores = {}
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def score_notebook(self, output_path):
+        username = os.path.basename(output_path).split('_')[0]
+        return self.scores.get(username, 50.0), None
+
+
+class TestReprocessSubmissions(unittest.TestCase):
+    """Test cases for batched result writes in reprocess_submissions."""
+
+    def setUp(self):
+        """Create a temporary database and submissions directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.test_dir, "test_leaderboard.db")
+        self.submissions_dir = os.path.join(self.test_dir, "submissions")
+        os.makedirs(self.submissions_dir)
+        self.db = Database(self.db_path)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.db.close()
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def create_notebooks(self, usernames):
+        """Write empty notebook files named like real submissions."""
+        for i, username in enumerate(usernames):
+            path = os.path.join(self.submissions_dir, f"{username}_20250101_12000{i}.ipynb")
+            with open(path, 'w') as f:
+                f.write("{}")
+
+    def run_reprocess(self, scores=None):
+        """Run reprocess_all_submissions with fake execution and scoring."""
+        FakeScorer.scores = scores or {}
+        with patch.object(reprocess_submissions, 'NotebookRunner', FakeRunner), \
+                patch.object(reprocess_submissions, 'Scorer', FakeScorer), \
+                redirect_stdout(io.StringIO()) as output:
+            reprocess_all_submissions(self.db_path, self.submissions_dir)
+        return output.getvalue()
+
+    def row(self, username, score=80.0):
+        """Build a pending result row."""
+        return {
+            'username': username,
+            'notebook_path': f"/path/{username}.ipynb",
+            'score': score,
+            'status': 'completed'
+        }
+
+    def test_flush_results_saves_batch(self):
+        """Test a batch is written in one call and the buffer emptied."""
+        pending = [self.row("alice"), self.row("bob")]
+
+        with redirect_stdout(io.StringIO()):
+            unsaved = flush_results(self.db, pending)
+
+        self.assertEqual(unsaved, [])
+        self.assertEqual(pending, [])
+        self.assertEqual(len(self.db.get_leaderboard()), 2)
+
+    def test_flush_results_falls_back_to_single_rows(self):
+        """Test one unsavable row does not lose the rest of the batch."""
+        pending = [self.row("alice"), self.row("bad", score=(1.0, None)), self.row("bob")]
+
+        with redirect_stdout(io.StringIO()):
+            unsaved = flush_results(self.db, pending)
+
+        self.assertEqual(unsaved, ["/path/bad.ipynb"])
+        self.assertEqual(pending, [])
+        self.assertEqual(
+            self.db.get_notebook_paths(),
+            {"/path/alice.ipynb", "/path/bob.ipynb"}
+        )
+
+    def test_reprocess_writes_in_batches(self):
+        """Test results are flushed every BATCH_SIZE notebooks and at the end."""
+        self.create_notebooks(["alice", "bob", "carol"])
+
+        # The buffer is cleared after each flush, so record batch sizes as
+        # they are written
+        batch_sizes = []
+        add_submissions_bulk = Database.add_submissions_bulk
+
+        def record_batch(db, submissions):
+            batch_sizes.append(len(submissions))
+            return add_submissions_bulk(db, submissions)
+
+        with patch.object(reprocess_submissions, 'BATCH_SIZE', 2), \
+                patch.object(Database, 'add_submissions_bulk', record_batch):
+            self.run_reprocess(scores={"bob": 90.0})
+
+        self.assertEqual(batch_sizes, [2, 1])
+        leaderboard = self.db.get_leaderboard()
+        self.assertEqual([entry['username'] for entry in leaderboard], ["bob", "alice", "carol"])
+
+        # A second run finds every notebook already stored
+        output = self.run_reprocess()
+        self.assertIn("Skipped (already in DB): 3", output)
+        self.assertEqual(len(self.db.get_all_submissions()), 3)
+
+    def test_reprocess_keeps_per_result_timestamps(self):
+        """Test results in one batch keep the time they were produced."""
+        self.create_notebooks(["alice", "bob", "carol"])
+
+        self.run_reprocess()
+
+        # Newest first, so the reverse of processing order
+        submissions = self.db.get_all_submissions()
+        self.assertEqual(len({sub['timestamp'] for sub in submissions}), 3)
+        self.assertEqual([sub['username'] for sub in submissions], ["carol", "bob", "alice"])
+
+    def test_reprocess_reports_unsaved_results(self):
+        """Test a result that cannot be saved is reported, not retried."""
+        self.create_notebooks(["alice", "bob"])
+
+        # Formats fine for the progress line, but sqlite3 cannot store it
+        output = self.run_reprocess(scores={"alice": Decimal("1.5")})
+
+        self.assertIn("Not saved to database: 1", output)
+        self.assertIn("alice_20250101_120000.ipynb", output)
+        self.assertEqual(len(self.db.get_all_submissions()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
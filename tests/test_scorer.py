@@ -4,11 +4,22 @@ import unittest
 import os
 import tempfile
 import shutil
+import numpy as np
 import pandas as pd
+from unittest.mock import patch
+from sklearn.model_selection import cross_val_score
 
 from src.scorer import Scorer
 
 
+# Default CSV content for both helpers, rendered once
+DEFAULT_CSV = pd.DataFrame({
+    'A': [1, 2, 3],
+    'B': [4, 5, 6],
+    'C': [7, 8, 9]
+}).to_csv(index=False)
+
+
 class TestScorer(unittest.TestCase):
     """Test cases for Scorer class."""
     
@@ -24,28 +35,17 @@ class TestScorer(unittest.TestCase):
     
     def create_csv_file(self, filename="output.csv", data=None):
         """Helper to create a CSV file."""
-        if data is None:
-            data = pd.DataFrame({
-                'A': [1, 2, 3],
-                'B': [4, 5, 6],
-                'C': [7, 8, 9]
-            })
-        
         filepath = os.path.join(self.temp_dir, filename)
-        data.to_csv(filepath, index=False)
+        if data is None:
+            with open(filepath, 'w') as f:
+                f.write(DEFAULT_CSV)
+        else:
+            data.to_csv(filepath, index=False)
         return filepath
     
     def create_ground_truth_csv(self, filename="ground_truth.csv"):
         """Helper to create a ground truth CSV file."""
-        data = pd.DataFrame({
-            'A': [1, 2, 3],
-            'B': [4, 5, 6],
-            'C': [7, 8, 9]
-        })
-        
-        filepath = os.path.join(self.temp_dir, filename)
-        data.to_csv(filepath, index=False)
-        return filepath
+        return self.create_csv_file(filename)
     
     def test_scorer_initialization(self):
         """Test scorer initialization."""
@@ -64,6 +64,20 @@ class TestScorer(unittest.TestCase):
         scorer = Scorer(ground_truth_path="/nonexistent/path.csv")
         self.assertIsNone(scorer.ground_truth)
     
+    def test_ground_truth_read_once_until_modified(self):
+        """Test that scorers share a parsed ground truth until the file changes."""
+        gt_path = self.create_ground_truth_csv()
+        first = Scorer(ground_truth_path=gt_path)
+        second = Scorer(ground_truth_path=gt_path)
+        self.assertIs(first.ground_truth, second.ground_truth)
+        
+        # Rewrite with a new modification time
+        self.create_csv_file("ground_truth.csv", data=pd.DataFrame({'A': [1]}))
+        stat = os.stat(gt_path)
+        os.utime(gt_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = Scorer(ground_truth_path=gt_path)
+        self.assertEqual(len(third.ground_truth), 1)
+    
     def test_score_notebook_no_csv(self):
         """Test scoring when no CSV file exists."""
         # Create empty directory with a dummy notebook
@@ -169,6 +183,24 @@ class TestScorer(unittest.TestCase):
         self.assertEqual(score, 0.0)
         # Error may or may not be present depending on how sklearn handles it
     
+    def test_baseline_r2_computed_once(self):
+        """Test that the ground truth baseline is cross-validated only once."""
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame({'A': rng.normal(size=40), 'B': rng.normal(size=40)})
+        data['MedHouseVal'] = 2 * data['A'] + rng.normal(scale=0.1, size=40)
+        gt_path = self.create_csv_file("ground_truth.csv", data=data)
+        csv_path = self.create_csv_file("submission.csv", data=data)
+        scorer = Scorer(ground_truth_path=gt_path)
+
+        with patch('src.scorer.cross_val_score', wraps=cross_val_score) as mock_cv:
+            first, _ = scorer.score_from_csv_path(csv_path)
+            second, _ = scorer.score_from_csv_path(csv_path)
+
+        # One baseline run plus one run per submission
+        self.assertEqual(mock_cv.call_count, 3)
+        self.assertAlmostEqual(first, 0.0)
+        self.assertAlmostEqual(second, 0.0)
+
     def test_basic_csv_validation(self):
         """Test basic CSV validation when no ground truth exists."""
         # Create CSV
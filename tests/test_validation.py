@@ -5,7 +5,30 @@ import os
 import tempfile
 import json
 
-from utils.validation import NotebookValidator, validate_submission
+from utils.validation import NotebookValidator, validate_submission, validate_upload
+
+
+# Serialized once; create_valid_notebook just writes this string
+VALID_NOTEBOOK_JSON = json.dumps({
+    "cells": [
+        {
+            "cell_type": "code",
+            "execution_count": None,
+            "metadata": {},
+            "outputs": [],
+            "source": ["print('Hello World')"]
+        }
+    ],
+    "metadata": {
+        "kernelspec": {
+            "display_name": "Python 3",
+            "language": "python",
+            "name": "python3"
+        }
+    },
+    "nbformat": 4,
+    "nbformat_minor": 4
+})
 
 
 class TestNotebookValidator(unittest.TestCase):
@@ -24,30 +47,9 @@ class TestNotebookValidator(unittest.TestCase):
     
     def create_valid_notebook(self, filename="test.ipynb"):
         """Helper to create a valid notebook file."""
-        notebook_content = {
-            "cells": [
-                {
-                    "cell_type": "code",
-                    "execution_count": None,
-                    "metadata": {},
-                    "outputs": [],
-                    "source": ["print('Hello World')"]
-                }
-            ],
-            "metadata": {
-                "kernelspec": {
-                    "display_name": "Python 3",
-                    "language": "python",
-                    "name": "python3"
-                }
-            },
-            "nbformat": 4,
-            "nbformat_minor": 4
-        }
-        
         filepath = os.path.join(self.temp_dir, filename)
         with open(filepath, 'w') as f:
-            json.dump(notebook_content, f)
+            f.write(VALID_NOTEBOOK_JSON)
         
         return filepath
     
@@ -87,10 +89,9 @@ class TestNotebookValidator(unittest.TestCase):
         """Test validation of file exceeding size limit."""
         filepath = os.path.join(self.temp_dir, "large.ipynb")
         
-        # Create file larger than 1MB limit
-        with open(filepath, 'w') as f:
-            # Write more than 1MB of data
-            f.write('x' * (2 * 1024 * 1024))
+        # Create file larger than 1MB limit (sparse; only its size is checked)
+        with open(filepath, 'wb') as f:
+            f.truncate(2 * 1024 * 1024)
         
         is_valid, error = self.validator.validate_file(filepath)
         self.assertFalse(is_valid)
@@ -261,6 +262,24 @@ class TestNotebookValidator(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIsNotNone(error)
     
+    def test_validate_upload_success(self):
+        """Test validate_upload accepts a valid username and size."""
+        is_valid, error = validate_upload("testuser", 1024, max_file_size_mb=1.0)
+        self.assertTrue(is_valid)
+        self.assertIsNone(error)
+    
+    def test_validate_upload_too_large(self):
+        """Test validate_upload rejects oversize uploads without a file."""
+        is_valid, error = validate_upload("testuser", 2 * 1024 * 1024, max_file_size_mb=1.0)
+        self.assertFalse(is_valid)
+        self.assertIn("too large", error)
+    
+    def test_validate_upload_invalid_username(self):
+        """Test validate_upload rejects usernames unsafe for file names."""
+        is_valid, error = validate_upload("../../etc", 1024)
+        self.assertFalse(is_valid)
+        self.assertIsNotNone(error)
+    
     def test_validate_notebook_structure_with_patterns(self):
         """Test validation of notebook structure with required patterns."""
         filepath = self.create_valid_notebook()
@@ -21,35 +21,31 @@ from src.logger import configure_warnings_logging
 configure_warnings_logging()
 
 
-def fix_running_submissions():
-    """Update all submissions with 'running' status to 'failed'."""
-    db = Database('data/leaderboard.db')
+def fix_running_submissions(db_path: str = 'data/leaderboard.db'):
+    """Update all submissions with 'running' status to 'failed'.
+    
+    Args:
+        db_path: Path to the SQLite database file
+    """
+    db = Database(db_path)
 
-    all_submissions = db.get_all_submissions()
-    running = [s for s in all_submissions if s['status'] == 'running']
+    updated = db.fail_running_submissions('Execution timeout or interrupted')
 
-    if not running:
+    if not updated:
         print("\nNo running submissions found.")
         return
 
-    print(f"\nFound {len(running)} running submission(s):")
+    print(f"\nFound {len(updated)} running submission(s):")
     print("-" * 80)
     print(f"{'ID':<5} {'Username':<20} {'Timestamp'}")
     print("-" * 80)
-    for sub in running:
+    for sub in updated:
         print(f"{sub['id']:<5} {sub['username']:<20} {sub['timestamp']}")
 
-    print("\nThese will be marked as 'failed' with error message:")
+    print("\nThese were marked as 'failed' with error message:")
     print("  'Execution timeout or interrupted'")
 
-    for sub in running:
-        db.update_submission(
-            sub['id'],
-            status='failed',
-            error_message='Execution timeout or interrupted'
-        )
-
-    print(f"\n✅ Updated {len(running)} submission(s) from 'running' to 'failed'")
+    print(f"\n✅ Updated {len(updated)} submission(s) from 'running' to 'failed'")
 
 
 if __name__ == '__main__':
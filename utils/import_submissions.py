@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Import past submissions from a JSON Lines file.
+
+Each line is one submission object with at least 'username' and
+'notebook_path', and optionally 'timestamp', 'status' (default 'completed'),
+'score', 'error_message' and 'notebook_hash'. Rows are written in batches,
+one transaction per batch, and the leaderboard is rebuilt for every
+imported user.
+
+Usage:
+    python utils/import_submissions.py <submissions.jsonl>
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import Database
+from src.logger import configure_warnings_logging
+
+# Configure warnings to be captured in logs
+configure_warnings_logging()
+
+BATCH_SIZE = 1000
+
+
+def import_submissions(db: Database, jsonl_path: str) -> int:
+    """Import submissions from a JSON Lines file in batches.
+
+    Args:
+        db: Database to import into
+        jsonl_path: Path to the JSON Lines file
+
+    Returns:
+        Number of submissions imported
+    """
+    imported = 0
+    batch = []
+
+    with open(jsonl_path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            batch.append(json.loads(line))
+            if len(batch) == BATCH_SIZE:
+                imported += db.add_submissions_bulk(batch)
+                batch = []
+
+    imported += db.add_submissions_bulk(batch)
+    return imported
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: python utils/import_submissions.py <submissions.jsonl>")
+        sys.exit(1)
+
+    db = Database('data/leaderboard.db')
+    count = import_submissions(db, sys.argv[1])
+    print(f"\n✅ Imported {count} submission(s)")
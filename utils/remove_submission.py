@@ -26,16 +26,21 @@ configure_warnings_logging()
 
 def list_submissions(db: Database):
     """List all submissions to help identify which one to delete."""
-    submissions = db.get_all_submissions()
+    submissions = db.get_submission_summaries()
 
-    print("\nAll Submissions:")
-    print("-" * 80)
-    print(f"{'ID':<5} {'Username':<20} {'Score':<10} {'Status':<12} {'Timestamp'}")
-    print("-" * 80)
+    lines = [
+        "\nAll Submissions:",
+        "-" * 80,
+        f"{'ID':<5} {'Username':<20} {'Score':<10} {'Status':<12} {'Timestamp'}",
+        "-" * 80,
+    ]
 
     for row in submissions:
         score_str = f"{row['score']:.2f}" if row['score'] is not None else "N/A"
-        print(f"{row['id']:<5} {row['username']:<20} {score_str:<10} {row['status']:<12} {row['timestamp']}")
+        lines.append(f"{row['id']:<5} {row['username']:<20} {score_str:<10} {row['status']:<12} {row['timestamp']}")
+
+    # One write for the whole table instead of one per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def remove_submission(db: Database, submission_id: int):
@@ -59,6 +64,8 @@ def remove_submission(db: Database, submission_id: int):
 
     removed = db.remove_submission(submission_id)
     if removed:
+        # Reclaim the freed pages and refresh planner statistics
+        db.maintenance()
         print(f"\nRemoved submission ID {submission_id}")
         print("\nDone!")
     else:
@@ -12,6 +12,7 @@ import os
 import sys
 from pathlib import Path
 import re
+from datetime import datetime
 
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -25,6 +26,12 @@ from src.logger import configure_warnings_logging
 # Configure warnings to be captured in logs
 configure_warnings_logging()
 
+# Submission filenames: username_YYYYMMDD_HHMMSS.ipynb
+FILENAME_PATTERN = re.compile(r'^(.+?)_\d{8}_\d{6}\.ipynb$')
+
+# Number of results written to the database per transaction
+BATCH_SIZE = 10
+
 
 def extract_username_from_filename(filename):
     """Extract username from submission filename.
@@ -35,30 +42,78 @@ def extract_username_from_filename(filename):
     Returns:
         Username or None if pattern doesn't match
     """
-    # Format: username_timestamp.ipynb
-    match = re.match(r'^(.+?)_\d{8}_\d{6}\.ipynb$', filename)
+    match = FILENAME_PATTERN.match(filename)
     if match:
         return match.group(1)
     return None
 
 
-def reprocess_all_submissions():
-    """Reprocess all notebooks in the submissions directory."""
+def flush_results(db, pending):
+    """Write buffered results to the database and empty the buffer.
+    
+    If the batch cannot be written, each result is retried on its own so
+    one bad row does not lose the rest of the batch. The buffer is emptied
+    either way, so a failed row is never retried by a later flush.
+    
+    Args:
+        db: Database to write to
+        pending: List of submission dictionaries for add_submissions_bulk
+        
+    Returns:
+        Notebook paths of the results that could not be saved
+    """
+    if not pending:
+        return []
+    
+    try:
+        db.add_submissions_bulk(pending)
+        print(f"  💾 Saved {len(pending)} result(s) to database")
+        return []
+    except Exception as e:
+        print(f"  ⚠️  Could not save batch ({e}), saving results one at a time")
+        unsaved = []
+        for row in pending:
+            try:
+                db.add_submissions_bulk([row])
+            except Exception as row_error:
+                print(f"  ❌ Could not save {row['notebook_path']}: {row_error}")
+                unsaved.append(row['notebook_path'])
+        return unsaved
+    finally:
+        pending.clear()
+
+
+def reprocess_all_submissions(
+    db_path='data/leaderboard.db',
+    submissions_dir='data/submissions'
+):
+    """Reprocess all notebooks in the submissions directory.
+    
+    Args:
+        db_path: Path to the leaderboard database
+        submissions_dir: Directory containing the submitted notebooks
+    """
     
     # Initialize components
-    db = Database('data/leaderboard.db')
-    runner = NotebookRunner('data/outputs', timeout_seconds=300)
+    db = Database(db_path)
+    # Start the next notebook's kernel while the current one runs
+    runner = NotebookRunner('data/outputs', timeout_seconds=300, warm_kernels=1)
     scorer = Scorer(ground_truth_path='data/california_housing.csv')
     leaderboard = LeaderboardManager(db)
     
-    submissions_dir = Path('data/submissions')
+    submissions_dir = Path(submissions_dir)
     
     if not submissions_dir.exists():
         print("Error: Submissions directory does not exist!")
         return
     
-    # Get all notebook files
-    notebooks = list(submissions_dir.glob('*.ipynb'))
+    # Get all notebook files, sorted by name
+    with os.scandir(submissions_dir) as entries:
+        notebooks = sorted(
+            submissions_dir / entry.name
+            for entry in entries
+            if entry.name.endswith('.ipynb') and entry.is_file()
+        )
     
     if not notebooks:
         print("No notebooks found in submissions directory")
@@ -66,75 +121,95 @@ def reprocess_all_submissions():
     
     print(f"Found {len(notebooks)} notebooks to process\n")
     
+    # Load every stored path once instead of querying per notebook
+    existing_paths = db.get_notebook_paths()
+    
     processed = 0
     skipped = 0
     errors = 0
+    unsaved = []
     
-    for notebook_path in sorted(notebooks):
-        filename = notebook_path.name
-        username = extract_username_from_filename(filename)
-        
-        if not username:
-            print(f"❌ Could not extract username from: {filename}")
-            errors += 1
-            continue
-        
-        print(f"Processing: {filename} (user: {username})")
-        
-        try:
-            # Check if this submission already exists in database
-            existing = db.get_user_submissions(username)
-            already_exists = any(sub['notebook_path'] == str(notebook_path) for sub in existing)
+    # Results are written in batches: one transaction (and one Hub upload)
+    # per batch instead of two per notebook. Each result carries its own
+    # timestamp so a batch does not share the flush time.
+    pending = []
+    
+    try:
+        for notebook_path in notebooks:
+            filename = notebook_path.name
+            username = extract_username_from_filename(filename)
             
-            if already_exists:
-                print(f"  ⏭️  Already in database, skipping")
-                skipped += 1
+            if not username:
+                print(f"❌ Could not extract username from: {filename}")
+                errors += 1
                 continue
             
-            # Execute the notebook
-            success, output_path, error_message = runner.execute_notebook(str(notebook_path))
+            print(f"Processing: {filename} (user: {username})")
             
-            if success and output_path and os.path.exists(output_path):
-                # Score the output
-                score = scorer.score_notebook(output_path)
-                
-                # Add to database
-                submission_id = db.add_submission(
-                    username=username,
-                    notebook_path=str(notebook_path),
-                    score=score,
-                    status='completed'
-                )
+            try:
+                # Check if this submission already exists in database
+                if str(notebook_path) in existing_paths:
+                    print(f"  ⏭️  Already in database, skipping")
+                    skipped += 1
+                    continue
                 
-                # Update leaderboard
-                db.update_leaderboard(username, submission_id, score)
+                # Execute the notebook
+                success, output_path, error_message = runner.execute_notebook(str(notebook_path))
                 
-                print(f"  ✅ Score: {score:.2f}, Added to database (ID: {submission_id})")
-                processed += 1
-            else:
-                print(f"  ❌ Execution failed: {error_message}")
-                db.add_submission(
-                    username=username,
-                    notebook_path=str(notebook_path),
-                    score=0.0,
-                    status='failed',
-                    error_message=error_message or 'Notebook execution failed'
-                )
+                if success and output_path and os.path.exists(output_path):
+                    # Score the output
+                    score, scoring_error = scorer.score_notebook(output_path)
+                    
+                    if scoring_error:
+                        print(f"  ❌ Scoring failed: {scoring_error}")
+                        pending.append({
+                            'username': username,
+                            'notebook_path': str(notebook_path),
+                            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
+                            'score': 0.0,
+                            'status': 'failed',
+                            'error_message': scoring_error
+                        })
+                        errors += 1
+                    else:
+                        print(f"  ✅ Score: {score:.2f}")
+                        pending.append({
+                            'username': username,
+                            'notebook_path': str(notebook_path),
+                            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
+                            'score': score,
+                            'status': 'completed'
+                        })
+                        processed += 1
+                else:
+                    print(f"  ❌ Execution failed: {error_message}")
+                    pending.append({
+                        'username': username,
+                        'notebook_path': str(notebook_path),
+                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
+                        'score': 0.0,
+                        'status': 'failed',
+                        'error_message': error_message or 'Notebook execution failed'
+                    })
+                    errors += 1
+                    
+            except Exception as e:
+                print(f"  ❌ Error: {str(e)}")
+                pending.append({
+                    'username': username,
+                    'notebook_path': str(notebook_path),
+                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
+                    'score': 0.0,
+                    'status': 'failed',
+                    'error_message': str(e)
+                })
                 errors += 1
-                
-        except Exception as e:
-            print(f"  ❌ Error: {str(e)}")
-            try:
-                db.add_submission(
-                    username=username,
-                    notebook_path=str(notebook_path),
-                    score=0.0,
-                    status='failed',
-                    error_message=str(e)
-                )
-            except:
-                pass
-            errors += 1
+            
+            if len(pending) >= BATCH_SIZE:
+                unsaved.extend(flush_results(db, pending))
+    finally:
+        # Keep finished results even if the run is interrupted
+        unsaved.extend(flush_results(db, pending))
     
     print(f"\n{'='*60}")
     print(f"Reprocessing complete!")
@@ -142,6 +217,10 @@ def reprocess_all_submissions():
     print(f"  Skipped (already in DB): {skipped}")
     print(f"  Errors: {errors}")
     print(f"  Total notebooks: {len(notebooks)}")
+    if unsaved:
+        print(f"  Not saved to database: {len(unsaved)}")
+        for path in unsaved:
+            print(f"    {path}")
     print(f"{'='*60}")
 
 
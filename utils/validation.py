@@ -2,9 +2,15 @@
 
 import os
 import json
+import re
 from typing import Tuple, Optional
 
 
+# Letters, digits, underscores, hyphens and periods. \w matches the same
+# Unicode letters and digits as str.isalnum(), plus the underscore.
+USERNAME_PATTERN = re.compile(r'[\w.-]+')
+
+
 class NotebookValidator:
     """Validates Jupyter notebook submissions."""
     
@@ -16,6 +22,25 @@ class NotebookValidator:
         """
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
     
+    def validate_file_size(self, file_size: int) -> Tuple[bool, Optional[str]]:
+        """Validate a file size against the configured limit.
+        
+        Args:
+            file_size: File size in bytes
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if file_size > self.max_file_size_bytes:
+            max_mb = self.max_file_size_bytes / (1024 * 1024)
+            actual_mb = file_size / (1024 * 1024)
+            return False, f"File too large: {actual_mb:.2f}MB (max: {max_mb:.2f}MB)"
+        
+        if file_size == 0:
+            return False, "File is empty"
+        
+        return True, None
+    
     def validate_file(self, file_path: str) -> Tuple[bool, Optional[str]]:
         """Validate a notebook file.
         
@@ -25,8 +50,10 @@ class NotebookValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check if file exists (a single stat also gives us the size)
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
             return False, "File does not exist"
         
         # Check file extension
@@ -34,15 +61,9 @@ class NotebookValidator:
             return False, "File must be a Jupyter notebook (.ipynb)"
         
         # Check file size
-        file_size = os.path.getsize(file_path)
-        if file_size > self.max_file_size_bytes:
-            max_mb = self.max_file_size_bytes / (1024 * 1024)
-            actual_mb = file_size / (1024 * 1024)
-            return False, f"File too large: {actual_mb:.2f}MB (max: {max_mb:.2f}MB)"
-        
-        # Check if file is empty
-        if file_size == 0:
-            return False, "File is empty"
+        is_valid, error = self.validate_file_size(file_size)
+        if not is_valid:
+            return False, error
         
         # Validate notebook format
         try:
@@ -63,9 +84,8 @@ class NotebookValidator:
             if len(notebook_content['cells']) == 0:
                 return False, "Notebook must contain at least one cell"
             
-            # Check if notebook has at least one code cell
-            code_cells = [cell for cell in notebook_content['cells'] if cell.get('cell_type') == 'code']
-            if len(code_cells) == 0:
+            # Check if notebook has at least one code cell (stops at the first)
+            if not any(cell.get('cell_type') == 'code' for cell in notebook_content['cells']):
                 return False, "Notebook must contain at least one code cell"
             
             return True, None
@@ -96,7 +116,7 @@ class NotebookValidator:
             return False, "Username must be less than 50 characters"
         
         # Check for valid characters (alphanumeric, underscore, hyphen)
-        if not all(c.isalnum() or c in ['_', '-', '.'] for c in username):
+        if not USERNAME_PATTERN.fullmatch(username):
             return False, "Username can only contain letters, numbers, underscores, hyphens, and periods"
         
         return True, None
@@ -123,16 +143,15 @@ class NotebookValidator:
             
             # If specific patterns are required, check for them
             if required_cell_patterns:
+                # Join each code cell's source once rather than once per pattern
+                code_sources = [
+                    ''.join(cell.get('source', []))
+                    for cell in cells
+                    if cell.get('cell_type') == 'code'
+                ]
+                
                 for pattern in required_cell_patterns:
-                    found = False
-                    for cell in cells:
-                        if cell.get('cell_type') == 'code':
-                            source = ''.join(cell.get('source', []))
-                            if pattern in source:
-                                found = True
-                                break
-                    
-                    if not found:
+                    if not any(pattern in source for source in code_sources):
                         return False, f"Required code pattern not found: {pattern}"
             
             return True, None
@@ -169,3 +188,28 @@ def validate_submission(
         return False, error
     
     return True, None
+
+
+def validate_upload(
+    username: str,
+    file_size: int,
+    max_file_size_mb: float = 10.0
+) -> Tuple[bool, Optional[str]]:
+    """Cheap checks to run on an upload before it is written to disk.
+    
+    Args:
+        username: Username submitting
+        file_size: Size of the uploaded file in bytes
+        max_file_size_mb: Maximum file size in megabytes
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    validator = NotebookValidator(max_file_size_mb=max_file_size_mb)
+    
+    # The username becomes part of the file name, so check it first
+    is_valid, error = validator.validate_username(username)
+    if not is_valid:
+        return False, error
+    
+    return validator.validate_file_size(file_size)